@@ -17,7 +17,7 @@ from src.gui import gui_helpers as gh
 from src.gui import images as img
 from src.gui.graphing.basicframe import StandardGraphManager
 from src.gui.main.expt_editor import SequenceFrame
-from src.gui.main.inst_control import INSTRUMENT_CONTROLLERS as ICS
+from src.gui.main.inst_control import getInstrumentControllers
 from src.gui.main.premade_loader import PremadeFrame
 from src.tools import loader
 
@@ -60,7 +60,7 @@ class TransportExperiment(wx.Frame):
         self.helpwindow = None
         
         self.controllerIDs = {}
-        for item in ICS:
+        for item in getInstrumentControllers():
             self.controllerIDs[item] = wx.NewIdRef()
         
         self.btnUserSettings = None
@@ -178,7 +178,7 @@ class TransportExperiment(wx.Frame):
             The frame which should be used as the parent of the controller frame
             to be opened.
         """
-        frame = ICS[name](parent)
+        frame = getInstrumentControllers()[name](parent)
         frame.Show()
         return frame
         
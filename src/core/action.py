@@ -227,6 +227,8 @@ class Action(object):
         """
         self._inst = inst
         self._method = eval('self._inst.' + self._methodString)
+        # The dialog used to edit the action may depend on its instrument
+        self.__dict__.pop('_dialogClass', None)
 
     def getInstrumentName(self):
         """Return the name of the instrument which will perform the action.
@@ -303,6 +305,35 @@ class Action(object):
             ans.append(curr)
         return ans
 
+    def getInputPropertyLists(self):
+        """Return the input properties for the action as parallel lists.
+        
+        This carries the same information as `getInputProperties`, arranged
+        for iterating over all of the inputs with `zip`.
+        
+        Returns
+        -------
+        list of str
+            The descriptions of the input parameters.
+        list of str
+            The names of the columns or parameters for the inputs.
+        list of str
+            The values of the inputs as formatted strings.
+        list
+            The allowed values for each input.
+        """
+        descriptions = []
+        columns = []
+        values = []
+        allowed = []
+        for parameter in self._inputs:
+            descriptions.append(parameter.description)
+            name = parameter.binName
+            columns.append('' if name is None else name)
+            values.append(parameter.getFormattedValue())
+            allowed.append(parameter.allowedValues)
+        return (descriptions, columns, values, allowed)
+
     def replaceStringInInput(self, inputIndex, original, replacement):
         """Perform a string replacement in one of the inputs for this action.
         
@@ -487,6 +518,7 @@ class Action(object):
         """Remove the method reference for pickling purposes."""
         odict = self.__dict__.copy()
         del odict['_method']
+        odict.pop('_dialogClass', None)
 #         if '_loopEnterCommands' in odict:
 #             del odict['_loopEnterCommands']
 #         if '_loopExitCommands' in odict:
@@ -1459,6 +1491,7 @@ class ActionLoopUntilInterrupt(ActionContainer):
         odict['_loopExitCommands'] = None
         odict['_statusMonitor'] = None
         del odict['_method']
+        odict.pop('_dialogClass', None)
         return odict
 
 
@@ -556,19 +556,20 @@ class Experiment(object):
         names of the columns in the order in which they will be written to the
         data file.
         """
-        num = [0]
+        num = 0
         def numberColumns(act):
             """Number the columns used by the specified action."""
+            nonlocal num
             if act is None:
                 return
             cols = act.getInputColumns() + act.getOutputColumns()
             for col in cols:
                 if col not in self._columnArray and col in self._columns:
-                    self._columns[col]['colindex'] = num[0]
+                    self._columns[col]['colindex'] = num
                     self._columnArray.append(col)
                     if __debug__:
-                        log.debug('Numbering column %s to %d.', col, num[0])
-                    num[0] += 1
+                        log.debug('Numbering column %s to %d.', col, num)
+                    num += 1
 
         self._traverse(numberColumns)
 
@@ -587,6 +588,16 @@ class Experiment(object):
         return (list(self._constants.keys()), list(self._columns.keys()),
                 list(self._parameters.keys()))
 
+    def getColumnCount(self):
+        """Return the number of data columns in the experiment.
+        
+        Returns
+        -------
+        int
+            The number of columns in the experiment.
+        """
+        return len(self._columns)
+
     def getStorageBinNamesString(self):
         """Return a formatted string representing the storage bin names.
         
@@ -860,13 +871,14 @@ class Experiment(object):
             problem, and the second is a message giving more detail about the
             problem.
         """
-        fileOpen = [False]
+        fileOpen = False
         answer = []
         definedColumns = []
         definedParameters = []
 
         def checkAuxActions(action):
             """Check each action for problems."""
+            nonlocal fileOpen
             if not action.isEnabled():
                 return
             name = action.getName()
@@ -876,7 +888,7 @@ class Experiment(object):
                 value = inputProperties[0]['value']
                 if not os.path.exists(os.path.normpath(value)):
                     answer.append('Folder "%s" does not exist.' % value)
-                fileOpen[0] = True
+                fileOpen = True
             elif name == 'calculate' or name == 'loop_while':
                 if name == 'calculate':
                     expression = inputProperties[0]['value']
@@ -894,7 +906,7 @@ class Experiment(object):
             newBins = _getCreatedBins(inputProperties, outputProperties)
             definedColumns.extend(newBins[0])
             definedParameters.extend(newBins[1])
-            if not fileOpen[0] and len(definedColumns) > 0:
+            if not fileOpen and len(definedColumns) > 0:
                 answer.append(('error', 'Writing to columns before ' +
                                'a file is opened: ' + str(definedColumns)))
         self._traverse(checkAuxActions)
@@ -957,17 +969,18 @@ class Experiment(object):
         name = name.strip()
         if binType == 'parameter':
             name = PARAM_ID + name
-        count = [0]
+        count = 0
 
         def counter(action):
             """Helper function to count occurrences in each action."""
+            nonlocal count
             colnames = action.getInputColumns() + action.getOutputColumns()
             for colname in colnames:
                 if colname == name:
-                    count[0] += 1
+                    count += 1
         self._traverse(counter)
 
-        return count[0]
+        return count
 
     def _updateEvaluations(self, oldName, oldType, newName, newType):
         """Change evaluations to reflect bin name changes.
@@ -646,6 +646,7 @@ class InstrumentPanel(wx.Panel):
         self.currmethod.setArguments(self.methargs.getData())
                 
     def _onSelectMethod(self, event):
+        self.methargs.flushUpdate()
         self.currmethod = self.methods[self.methlist.GetSelection()]
         self.updateMethodDetails()
         
@@ -663,6 +664,7 @@ class InstrumentPanel(wx.Panel):
 
         
     def _onAddMethod(self, event):
+        self.methargs.flushUpdate()
         newmethod = self.instrument.addMethod('pleaseNameMe')
         self.updateMethodList()
         self.currmethod = newmethod
@@ -670,6 +672,7 @@ class InstrumentPanel(wx.Panel):
         self.updateMethodDetails()
         
     def _onRemoveMethod(self, event):
+        self.methargs.flushUpdate()
         self.instrument.deleteMethod(self.currmethod.name)
         self.updateMethodList()
         self.currmethod = self.methods[0]
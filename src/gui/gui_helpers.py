@@ -97,12 +97,14 @@ class StaticListCtrl(wx.ListCtrl, ListCtrlAutoWidthMixin):
     listFormat : int or list of int
         Flags to indicate the formatting of the columns. If the input is a
         list, each element will be applied to a different column.
+    style : int
+        Additional style flags for the control, such as `wx.LC_VIRTUAL`.
     """
     
     def __init__(self, parent, wxId=wx.ID_ANY, headers=None, 
-                 listFormat=wx.LIST_FORMAT_RIGHT):
+                 listFormat=wx.LIST_FORMAT_RIGHT, style=0):
         wx.ListCtrl.__init__(self, parent, wxId, 
-                             style=wx.LC_REPORT|wx.BORDER_SIMPLE)
+                             style=wx.LC_REPORT|wx.BORDER_SIMPLE|style)
         ListCtrlAutoWidthMixin.__init__(self)
         
         if headers is None:
@@ -116,7 +118,8 @@ class StaticListCtrl(wx.ListCtrl, ListCtrlAutoWidthMixin):
             self.__format = [listFormat]*len(self.__headers)
 
         self._createColumns()
-        self.InsertItem(0, '')
+        if not style & wx.LC_VIRTUAL:
+            self.InsertItem(0, '')
         
         self.Bind(wx.EVT_SIZE, self._onSize)
         
@@ -135,10 +138,14 @@ class StaticListCtrl(wx.ListCtrl, ListCtrlAutoWidthMixin):
             A list of tuples of strings. Each tuple gets a row,
             and each string goes into its own column within the row.
         """
-        self.ClearAll()
-        self._createColumns()
-        for row in data:
-            self.Append(row)
+        self.Freeze()
+        try:
+            self.ClearAll()
+            self._createColumns()
+            for row in data:
+                self.Append(row)
+        finally:
+            self.Thaw()
 
     def getData(self):
         """Get the data stored in the table.
@@ -294,6 +301,10 @@ class ListCtrl(StaticListCtrl, TextEditMixin):
 
 class KeyValListCtrl(StaticListCtrl):
     """A list control for managing typed key-value pairs.
+    
+    The control is virtual: rather than holding copies of the rows, it
+    displays them directly from the list passed to `setValues`, so changing
+    the data only requires redrawing the rows which are affected.
      
     Parameters
     ----------
@@ -304,7 +315,72 @@ class KeyValListCtrl(StaticListCtrl):
     def __init__(self, parent):
         StaticListCtrl.__init__(self, parent, wx.ID_ANY, 
                                 headers=['Name', 'Default value', 'Type'],
-                                style=wx.LIST_FORMAT_LEFT)        
+                                listFormat=wx.LIST_FORMAT_LEFT,
+                                style=wx.LC_VIRTUAL)
+        self._rows = []
+        
+    def setValues(self, data):
+        """Set the data displayed by the table.
+        
+        Parameters
+        ----------
+        data : list of list of str
+            A list of three-element sequences (name, value, and type), one
+            for each row. The list is used directly rather than copied, so
+            later changes to it appear once the affected rows are refreshed.
+        """
+        self._rows = data
+        self.SetItemCount(len(data))
+        self.Refresh()
+        
+    def refreshRows(self, first, last):
+        """Redraw a range of rows after the data has been changed in place.
+        
+        Parameters
+        ----------
+        first : int
+            The index of the first row to redraw. Negative values are treated
+            as 0.
+        last : int
+            The index of the last row to redraw. Rows past the end of the
+            data are ignored.
+        """
+        count = len(self._rows)
+        if self.GetItemCount() != count:
+            self.SetItemCount(count)
+        first = max(first, 0)
+        last = min(last, count - 1)
+        if first <= last:
+            self.RefreshItems(first, last)
+        
+    def getData(self):
+        """Get the data displayed by the table.
+        
+        Returns
+        -------
+        list of tuple of str
+            A list of tuples of strings. Each tuple represents a single row.
+        """
+        return [tuple(row) for row in self._rows]
+        
+    def getRowData(self, index):
+        """Get the data from one row of the table.
+        
+        Parameters
+        ----------
+        index : int
+            The index of the row whose data should be returned.
+            
+        Returns
+        -------
+        list of str
+            A list of strings containing the data from the specified row.
+        """
+        return list(self._rows[index])
+        
+    def OnGetItemText(self, item, column):
+        """Return the text for one cell of the virtual table."""
+        return self._rows[item][column]
 
 
 #===============================================================================
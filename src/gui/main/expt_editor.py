@@ -4,7 +4,6 @@ import pickle
 from collections import namedtuple
 from functools import partial
 import logging
-import re
 import textwrap
 import wx
 
@@ -115,6 +114,7 @@ class SequenceFrame(ExperimentFrame):
         self.tree.SetDropTarget(self.dropTarget)
 
         self._interrupt = False
+        self._namePending = False
 
         self.__edited = False
         self.editMenu = None
@@ -210,7 +210,9 @@ class SequenceFrame(ExperimentFrame):
             Whether the experiment has been edited.
         """
         self.__edited = newValue
-        self.updateName()
+        if not self._namePending:
+            self._namePending = True
+            wx.CallAfter(self._updatePendingName)
     edited = property(getEdited, setEdited)
     def flagEdit(self):
         """Indicate that the experiment has been edited.
@@ -219,6 +221,12 @@ class SequenceFrame(ExperimentFrame):
         """
         self.edited = True
 
+    def _updatePendingName(self):
+        """Update the title bars once for any edits flagged since the last."""
+        self._namePending = False
+        if self:
+            self.updateName()
+
     def onRun(self, event=None):
         """Run the experiment."""
         smon = progress.getStatusMonitor('main')
@@ -531,11 +539,16 @@ class ActionTree(wx.TreeCtrl):
         self.clipboard = None
         self.moveData = None
         self.activeItem = None
+        self._parentCache = {}
+        self._refreshPending = False
+        self._lastClipStatus = (None, None)
         self.root = self.AddRoot('The Root Item')
         self.SetItemData(self.root, self.experiment.getActionRoot())
         self.SetIndent(_INDENT)
         self.endmarkFont = wx.Font(9, wx.FONTFAMILY_DEFAULT,
                                    wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL)
+        self._contextMenu = self._createContextMenu()
+        self._contextMenuState = None
 
         # Bind the event handlers
         self.Bind(wx.EVT_TREE_ITEM_ACTIVATED, self._onDoubleClick)
@@ -543,6 +556,7 @@ class ActionTree(wx.TreeCtrl):
         self.Bind(wx.EVT_LEFT_DOWN, self._onLeftClick)
         self.Bind(wx.EVT_TREE_BEGIN_DRAG, self._onBeginDrag)
         self.Bind(wx.EVT_TREE_END_DRAG, self._onEndDrag)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self._onDestroy)
 
         self.ExpandAll()
 
@@ -578,7 +592,20 @@ class ActionTree(wx.TreeCtrl):
         self.ExpandAll()
 
     def refresh(self):
-        """Fill in the entire tree from the experiment's action sequence."""
+        """Fill in the entire tree from the experiment's action sequence.
+        
+        The tree is rebuilt once control returns to the event loop, so
+        several calls made in quick succession result in a single rebuild.
+        """
+        if not self._refreshPending:
+            self._refreshPending = True
+            wx.CallAfter(self._doRefresh)
+
+    def _doRefresh(self):
+        """Rebuild the tree if the control still exists."""
+        self._refreshPending = False
+        if not self:
+            return
         self.DeleteChildren(self.root)
 
         self._buildSubtree(self.root)
@@ -636,6 +663,49 @@ class ActionTree(wx.TreeCtrl):
         return None
 
 
+    #===========================================================================
+    # Parent lookup
+    #===========================================================================
+
+    def _parent(self, item):
+        """Return the parent of a tree item, using the parent cache if possible.
+        
+        Parameters
+        ----------
+        item : wxTreeItemId
+            The item whose parent is sought.
+        
+        Returns
+        -------
+        wxTreeItemId
+            The parent of `item`.
+        """
+        parent = self._parentCache.get(item)
+        if parent is None:
+            parent = self.GetItemParent(item)
+        return parent
+
+    # pylint: disable=C0103
+    def Delete(self, item):
+        """Delete an item and its children, updating the parent cache.
+        
+        Only the entry for `item` itself is removed. Entries for its
+        descendants are harmless, since any item which reuses their ids is
+        given a new entry when it is inserted.
+        """
+        self._parentCache.pop(item, None)
+        self._lastClipStatus = (None, None)
+        super(ActionTree, self).Delete(item)
+
+    def DeleteChildren(self, item):
+        """Delete the children of an item, clearing the cache for the root."""
+        if item == self.root:
+            self._parentCache.clear()
+        self._lastClipStatus = (None, None)
+        super(ActionTree, self).DeleteChildren(item)
+    # pylint: enable=C0103
+
+
     #===========================================================================
     # Action and item insertion
     #===========================================================================
@@ -661,6 +731,7 @@ class ActionTree(wx.TreeCtrl):
             The newly created and appended item.
         """
         newItem = self.AppendItem(parentItem, str(action))
+        self._parentCache[newItem] = parentItem
         if action.isEnabled():
             self.SetItemTextColour(newItem, wx.BLACK)
         else:
@@ -702,6 +773,7 @@ class ActionTree(wx.TreeCtrl):
         else:
             previousItem = self.GetPrevSibling(posItem)
             newItem = self.InsertItem(parentItem, previousItem, newItemText)
+        self._parentCache[newItem] = parentItem
         if not skipCore:
             parentAction = self.GetItemData(parentItem)
             posAction = self.GetItemData(posItem)
@@ -756,6 +828,7 @@ class ActionTree(wx.TreeCtrl):
             marker.
         """
         newMark = self.AppendItem(parentItem, '-----------------')
+        self._parentCache[newMark] = parentItem
         self.SetItemTextColour(newMark, wx.LIGHT_GREY)
         # self.SetItemFont(newMark, self.endmarkFont)
         self.SetItemData(newMark, None)
@@ -781,12 +854,12 @@ class ActionTree(wx.TreeCtrl):
             The item to cut from the tree.
         """
         self.clearClipboard()
-        parentItem = self.GetItemParent(item)
+        parentItem = self._parent(item)
         parentAction = self.GetItemData(parentItem)
         action = self.GetItemData(item)
         self.Delete(item)
         parentAction.removeChild(action)
-        self.clipboard = ('cut', action)
+        self.clipboard = ('cut', action, False)
         self.flagEdit()
 
     def copyAction(self, item):
@@ -799,7 +872,7 @@ class ActionTree(wx.TreeCtrl):
         """
         self.clearClipboard()
         action = self.GetItemData(item)
-        self.clipboard = ('copy', action.clone())
+        self.clipboard = ('copy', action.clone(), False)
 
     def pasteAction(self, item):
         """Paste an item from the clipboard onto the tree.
@@ -812,62 +885,87 @@ class ActionTree(wx.TreeCtrl):
         Notes
         -----
         At the end of this operation, the clipboard's `operation` flag is
-        always 'copy', and its `action` is always a clone of whatever action
-        was originally put there. That way, the user can continue to do paste
-        operations even if the clipboard was filled using a cut (and clones
-        do not need to be trashed, since they were never instantiated in the
-        first place).
+        always 'copy'. That way, the user can continue to do paste operations
+        even if the clipboard was filled using a cut.
+
+        The clipboard is copy-on-write: the pasted action is shared between
+        the tree and the clipboard rather than cloned straight away. It is
+        cloned only when it is pasted again or when the sequence is about to
+        be modified (see `_detachClipboard`), so a single paste costs no clone
+        at all.
         """
         if self.clipboard is not None:
-            action = self.clipboard[1]
+            _, action, shared = self.clipboard
+            if shared:
+                action = action.clone()
             if item is None:
                 self._appendAction(self.root, action)
             elif self.GetItemData(item) is None:
-                parentItem = self.GetItemParent(item)
+                parentItem = self._parent(item)
                 self.Delete(item)
                 self._appendAction(parentItem, action)
                 self._appendEndMark(parentItem)
             else:
-                parentItem = self.GetItemParent(item)
+                parentItem = self._parent(item)
                 self._insertActionAtItem(parentItem, item, action)
-            self.clipboard = ('copy', action.clone())
+            self.clipboard = ('copy', action, True)
             self.flagEdit()
 
+    def _detachClipboard(self):
+        """Give the clipboard its own copy of an action shared with the tree.
+        
+        This must be called before any action in the sequence is modified,
+        so that later pastes are not affected by the modification.
+        """
+        if self.clipboard is not None and self.clipboard[2]:
+            self.clipboard = ('copy', self.clipboard[1].clone(), False)
+
     def _updateClipboardStatus(self, item):
-        """Update the active item and the clipboard buttons."""
+        """Update the active item and the clipboard buttons.
+        
+        The buttons are left alone if neither the item nor the clipboard
+        state has changed since the last update.
+        """
         paste = self.clipboard is not None
-        if item is None:
-            self.activeItem = None
-            self.experimentFrame.setClipboardButtonStatus(False, False, paste)
-        elif self.GetItemData(item) is None:
-            self.activeItem = item
-            self.experimentFrame.setClipboardButtonStatus(False, False, paste)
-        else:
-            self.activeItem = item
-            self.experimentFrame.setClipboardButtonStatus(True, True, paste)
+        self.activeItem = item
+        lastItem, lastPaste = self._lastClipStatus
+        if paste == lastPaste:
+            if item is None or lastItem is None:
+                if item is lastItem:
+                    return
+            elif item == lastItem:
+                return
+        self._lastClipStatus = (item, paste)
+        hasAction = item is not None and self.GetItemData(item) is not None
+        self.experimentFrame.setClipboardButtonStatus(hasAction, hasAction,
+                                                      paste)
 
     def _traverse(self, func, startNode):
-        """Apply a function recursively to all children of an action.
-        
+        """Apply a function to a node and all of its descendants.
+
+        The sub-tree is walked depth-first in pre-order using an explicit
+        stack rather than recursion.
+
         Parameters
         ----------
         func : function
-            The function to apply to each node in the sub-tree.
+            The function to apply to each node in the sub-tree. It is called
+            with the node and its depth relative to `startNode`.
         startNode : wx.TreeItem
             The parent to which, and to whose children, the function should be
             applied.
         """
-
-        def traverseAux(node, depth, func):
-            """Traverse the sub-elements of the current node."""
-            count = self.GetChildrenCount(node, 0)
+        stack = [(startNode, 0)]
+        while stack:
+            node, depth = stack.pop()
+            func(node, depth)
+            children = []
             child, cookie = self.GetFirstChild(node)
-            for _ in range(count):
-                func(child, depth)
-                traverseAux(child, depth + 1, func)
+            for _ in range(self.GetChildrenCount(node, False)):
+                children.append(child)
                 child, cookie = self.GetNextChild(node, cookie)
-        func(startNode, 0)
-        traverseAux(startNode, 1, func)
+            for child in reversed(children):
+                stack.append((child, depth + 1))
 
     def _itemIsChildOf(self, potentialDescendant, ancestor):
         """Determine whether one item is a child of another.
@@ -884,15 +982,19 @@ class ActionTree(wx.TreeCtrl):
         bool
             `True` if `potentialDescendant` is in fact a descendant of
             `ancestor`, or `False` otherwise.
-        """
-        result = [False]
-        def _testFunction(node, _):
-            """Return whether a node is the desired descendant."""
-            if node == potentialDescendant:
-                result[0] = True
 
-        self._traverse(_testFunction, ancestor)
-        return result[0]
+        Notes
+        -----
+        The check walks up from `potentialDescendant` towards the root, so it
+        stops as soon as `ancestor` is found. An item is considered a child
+        of itself.
+        """
+        current = potentialDescendant
+        while current is not None and current.IsOk():
+            if current == ancestor:
+                return True
+            current = self._parent(current)
+        return False
 
     def _onBeginDrag(self, event):
         """Respond to drag start: record the item being dragged.
@@ -933,11 +1035,43 @@ class ActionTree(wx.TreeCtrl):
             item = None
             self.UnselectAll()
         else:
-            self._updateClipboardStatus(item)
             self.SelectItem(item)
         self._updateClipboardStatus(item)
         event.Skip()
 
+    def _createContextMenu(self):
+        """Create the context menu shown when a tree item is right-clicked.
+        
+        The menu is built once and reused; `_onRightClick` only updates the
+        enabled states and the label of the enable/disable item.
+        
+        Returns
+        -------
+        wx.Menu
+            The context menu for tree items.
+        """
+        menu = wx.Menu()
+
+        menu.Append(wx.ID_CUT, 'Cut')
+        menu.Append(wx.ID_COPY, 'Copy')
+        menu.Append(wx.ID_PASTE, 'Paste')
+        menu.AppendSeparator()
+        menu.Append(wx.ID_EDIT, 'Edit action')
+        menu.Append(wx.ID_DELETE, 'Delete action')
+        menu.Append(_ID_REBIND, 'Change instrument')
+        menu.Append(_ID_ENABLE, 'Enable action')
+
+        handlers = {wx.ID_CUT: self.onCut,
+                    wx.ID_COPY: self.onCopy,
+                    wx.ID_PASTE: self.onPaste,
+                    wx.ID_EDIT: self._onEditActiveAction,
+                    wx.ID_DELETE: self._onDeleteActiveAction,
+                    _ID_REBIND: self._onRebindActiveAction,
+                    _ID_ENABLE: self.onEnable}
+        for itemId, handler in handlers.items():
+            menu.Bind(wx.EVT_MENU, handler, id=itemId)
+        return menu
+
     def _onRightClick(self, event):
         """Respond to right click: show context menu."""
 
@@ -945,66 +1079,71 @@ class ActionTree(wx.TreeCtrl):
         item = event.GetItem()
         self.SelectItem(item)
         self._updateClipboardStatus(item)
+        data = self.GetItemData(item)
+        hasAction = data is not None
+        enabled = data.isEnabled() if hasAction else False
 
-        def editAction(eventSub):
-            """Edit the selected action."""
-            self.editAction(item)
+        menu = self._contextMenu
+        state = (hasAction, enabled, self.clipboard is not None)
+        if state != self._contextMenuState:
+            self._updateContextMenu(state)
 
-        def editInstrument(eventSub):
-            """Edit the instrument bound to the selected action."""
-            action = self.GetItemData(item)
-            instdialog = oc.RebindInstrumentDialog(self, self.experiment,
-                                                   action)
-            result = instdialog.ShowModal()
-            if result == wx.ID_OK:
-                instdialog.update()
-                self.SetItemText(item, str(action))
-
-        def deleteAction(eventSub):
-            """Delete the selected action."""
-            self.deleteAction(item)
-
-        menu = wx.Menu()
+        self.PopupMenu(menu)
 
-        menu.Append(wx.ID_CUT, 'Cut')
-        menu.Append(wx.ID_COPY, 'Copy')
-        menu.Append(wx.ID_PASTE, 'Paste')
-        menu.AppendSeparator()
-        menu.Append(wx.ID_EDIT, 'Edit action')
-        menu.Append(wx.ID_DELETE, 'Delete action')
-        menu.Append(_ID_REBIND, 'Change instrument')
-        if self.GetItemData(item) is not None:
-            menu.Enable(wx.ID_CUT, True)
-            menu.Enable(wx.ID_COPY, True)
-            menu.Enable(wx.ID_EDIT, True)
-            menu.Enable(wx.ID_DELETE, True)
-            menu.Enable(_ID_REBIND, True)
-            if self.GetItemData(item).isEnabled():
-                menu.Append(_ID_ENABLE, 'Disable action')
+    def _updateContextMenu(self, state):
+        """Update the labels and enabled states of the context menu.
+        
+        Only the items whose state differs from the previous popup are
+        touched.
+        
+        Parameters
+        ----------
+        state : tuple of bool
+            Whether the clicked item holds an action, whether that action is
+            enabled, and whether the clipboard holds anything to paste.
+        """
+        menu = self._contextMenu
+        oldState = self._contextMenuState
+        hasAction, enabled, paste = state
+        if oldState is None or enabled != oldState[1]:
+            if enabled:
+                menu.SetLabel(_ID_ENABLE, 'Disable action')
             else:
-                menu.Append(_ID_ENABLE, 'Enable action')
-        else:
-            menu.Enable(wx.ID_CUT, False)
-            menu.Enable(wx.ID_COPY, False)
-            menu.Enable(wx.ID_EDIT, False)
-            menu.Enable(wx.ID_DELETE, False)
-            menu.Enable(_ID_REBIND, False)
-            menu.Append(_ID_ENABLE, 'Enable action')
-            menu.Enable(_ID_ENABLE, False)
-        if self.clipboard is not None:
-            menu.Enable(wx.ID_PASTE, True)
-        else:
-            menu.Enable(wx.ID_PASTE, False)
+                menu.SetLabel(_ID_ENABLE, 'Enable action')
+        if oldState is None or hasAction != oldState[0]:
+            for itemId in (wx.ID_CUT, wx.ID_COPY, wx.ID_EDIT, wx.ID_DELETE,
+                           _ID_REBIND, _ID_ENABLE):
+                menu.Enable(itemId, hasAction)
+        if oldState is None or paste != oldState[2]:
+            menu.Enable(wx.ID_PASTE, paste)
+        self._contextMenuState = state
+
+    def _onEditActiveAction(self, event):
+        """Edit the action of the active item."""
+        self.editAction(self.activeItem)
+
+    def _onRebindActiveAction(self, event):
+        """Edit the instrument bound to the action of the active item."""
+        self._detachClipboard()
+        item = self.activeItem
+        action = self.GetItemData(item)
+        instdialog = oc.RebindInstrumentDialog(self, self.experiment, action)
+        result = instdialog.ShowModal()
+        if result == wx.ID_OK:
+            instdialog.update()
+            self.SetItemText(item, str(action))
 
-        menu.Bind(wx.EVT_MENU, self.onCut, id=wx.ID_CUT)
-        menu.Bind(wx.EVT_MENU, self.onCopy, id=wx.ID_COPY)
-        menu.Bind(wx.EVT_MENU, self.onPaste, id=wx.ID_PASTE)
-        menu.Bind(wx.EVT_MENU, editAction, id=wx.ID_EDIT)
-        menu.Bind(wx.EVT_MENU, deleteAction, id=wx.ID_DELETE)
-        menu.Bind(wx.EVT_MENU, editInstrument, id=_ID_REBIND)
-        menu.Bind(wx.EVT_MENU, self.onEnable, id=_ID_ENABLE)
+    def _onDeleteActiveAction(self, event):
+        """Delete the action of the active item."""
+        self.deleteAction(self.activeItem)
 
-        self.PopupMenu(menu)
+    def _onDestroy(self, event):
+        """Release the clipboard and the context menu with the tree."""
+        event.Skip()
+        if event.GetEventObject() is self:
+            self.clearClipboard()
+            self._parentCache.clear()
+            self._contextMenu.Destroy()
 
     def _onDoubleClick(self, event):
         """Respond to double click: edit the action."""
@@ -1014,22 +1153,19 @@ class ActionTree(wx.TreeCtrl):
 
     def onEnable(self, event):
         """Enable or disable the selected item."""
-        toEnable = [False]
-        def enableAux(node, dummy):
-            """Do something."""
-            if node is not None:
-                currentAction = self.GetItemData(node)
-                if currentAction is not None:
-                    currentAction.setEnabled(toEnable[0])
-
         item = self.GetSelection()
 
         if item is not None:
             action = self.GetItemData(item)
             if action is not None:
-                if not action.isEnabled():
-                    toEnable[0] = True
-                self._traverse(enableAux, item)
+                self._detachClipboard()
+                toEnable = not action.isEnabled()
+                stack = [action]
+                while stack:
+                    currentAction = stack.pop()
+                    currentAction.setEnabled(toEnable)
+                    if currentAction.allowsChildren():
+                        stack.extend(currentAction.getChildren())
                 self.flagEdit()
 
         self.refresh()
@@ -1038,19 +1174,22 @@ class ActionTree(wx.TreeCtrl):
         """Change the color of a tree of actions based on the top."""
         if top is None:
             return
-        action = self.GetItemData(top)
-        if action is None:
-            self.SetItemTextColour(top, wx.LIGHT_GREY)
-            return
-        if enable:
-            self.SetItemTextColour(top, wx.BLACK)
-        else:
-            self.SetItemTextColour(top, wx.LIGHT_GREY)
-        childrenCount = self.GetChildrenCount(top, False)
-        child, cookie = self.GetFirstChild(top)
-        for _ in range(childrenCount):
-            self.enableTree(child, enable)
-            child, cookie = self.GetNextChild(child, cookie)
+        colour = wx.BLACK if enable else wx.LIGHT_GREY
+        self.Freeze()
+        try:
+            stack = [top]
+            while stack:
+                node = stack.pop()
+                if self.GetItemData(node) is None:
+                    self.SetItemTextColour(node, wx.LIGHT_GREY)
+                    continue
+                self.SetItemTextColour(node, colour)
+                child, cookie = self.GetFirstChild(node)
+                for _ in range(self.GetChildrenCount(node, False)):
+                    stack.append(child)
+                    child, cookie = self.GetNextChild(node, cookie)
+        finally:
+            self.Thaw()
 
     def onCut(self, event):
         """Cut the item from the tree (pass the work to the tree)."""
@@ -1072,6 +1211,7 @@ class ActionTree(wx.TreeCtrl):
         action : Action
             The action to add to the end of the tree (at the highest level).
         """
+        self._detachClipboard()
         self._appendAction(self.root, action)
         self.flagEdit()
 
@@ -1087,6 +1227,7 @@ class ActionTree(wx.TreeCtrl):
         targetItem : wxTreeItemId
             The tree item above which the new action should be added.
         """
+        self._detachClipboard()
         instrument = self.experiment.getInstrument(actionTuple[0])
         actionSpec = instrument.getActions()[actionTuple[1]]
         action = constructAction(actionSpec)
@@ -1102,12 +1243,12 @@ class ActionTree(wx.TreeCtrl):
             if target is None:
                 self._appendAction(self.root, action)
             elif self.GetItemData(target) is None:
-                targetParent = self.GetItemParent(target)
+                targetParent = self._parent(target)
                 self.Delete(target)
                 self._appendAction(targetParent, action)
                 self._appendEndMark(targetParent)
             else:
-                targetParent = self.GetItemParent(target)
+                targetParent = self._parent(target)
                 self._insertActionAtItem(targetParent, target, action)
             self.flagEdit()
 
@@ -1119,6 +1260,7 @@ class ActionTree(wx.TreeCtrl):
         item : wxTreeItemId
             The item whose action the user wants to edit.
         """
+        self._detachClipboard()
         action = self.GetItemData(item)
         dialog = oc.getDialog(action)(self, self.experiment, actionIn=action)
         result = dialog.ShowModal()
@@ -1141,7 +1283,7 @@ class ActionTree(wx.TreeCtrl):
             The item before which `sourceItem` should be placed.
         """
         self.clearClipboard()
-        parentItem = self.GetItemParent(sourceItem)
+        parentItem = self._parent(sourceItem)
         parentAction = self.GetItemData(parentItem)
         action = self.GetItemData(sourceItem)
         self.Delete(sourceItem)
@@ -1150,12 +1292,12 @@ class ActionTree(wx.TreeCtrl):
         if targetItem is None:
             self._appendAction(self.root, action)
         elif self.GetItemData(targetItem) is None:
-            parentItem = self.GetItemParent(targetItem)
+            parentItem = self._parent(targetItem)
             self.Delete(targetItem)
             self._appendAction(parentItem, action)
             self._appendEndMark(parentItem)
         else:
-            parentItem = self.GetItemParent(targetItem)
+            parentItem = self._parent(targetItem)
             self._insertActionAtItem(parentItem, targetItem, action)
 #         self.clipboard = ('copy', action.clone())
         self.flagEdit()
@@ -1169,8 +1311,9 @@ class ActionTree(wx.TreeCtrl):
             The tree item which should be deleted, along with its associated
             action and all of their children.
         """
+        self._detachClipboard()
         action = self.GetItemData(item)
-        parentItem = self.GetItemParent(item)
+        parentItem = self._parent(item)
         parentAction = self.GetItemData(parentItem)
         parentAction.removeChild(action)
         action.trash()
@@ -1210,6 +1353,8 @@ class InstrumentFrame(wx.Frame):
             self.successAction = []
         else:
             self.successAction = successAction
+        self._shownInstruments = None
+        self._shownOptions = None
 
         mainpanel = gh.Panel(self, 'vertical')
 
@@ -1251,17 +1396,21 @@ class InstrumentFrame(wx.Frame):
         """Fill the available and included instruments boxes."""
         instrumentStrings = self.experiment.getInstrumentStrings()[2:]
         availableStrings = INSTRUMENT_MANAGER.getAvailableInstrumentStrings()
-        self.instrumentBox.SetItems(instrumentStrings)
+        if instrumentStrings != self._shownInstruments:
+            self.instrumentBox.SetItems(instrumentStrings)
+            self._shownInstruments = instrumentStrings
         if self.instrumentBox.GetCount() > 0:
             self.instrumentBox.SetSelection(0)
-        self.instrumentOptions.SetItems(availableStrings)
+        if availableStrings != self._shownOptions:
+            self.instrumentOptions.SetItems(availableStrings)
+            self._shownOptions = availableStrings
         self.instrumentOptions.Select(0)
         self.updateButtonEnabled()
 
     def updateButtonEnabled(self):
         """Enable and disable buttons based on selections."""
         isel = self.instrumentBox.GetSelection()
-        if 0 <= isel < len(self.instrumentBox.GetItems()):
+        if 0 <= isel < self.instrumentBox.GetCount():
             self.btnEdit.Enable(True)
             self.btnRemove.Enable(True)
         else:
@@ -1383,12 +1532,15 @@ class GraphFrame(wx.Frame):
     def populate(self):
         """Fill the list of graphs."""
         self.graphData = self.experiment.getGraphStringsAndStates()
-        self.graphs.SetItems([datum[0] for datum in self.graphData])
-        for index, datum in enumerate(self.graphData):
-            name, enabled = datum
-            if not enabled:
-                self.graphs.SetItemForegroundColour(index, wx.LIGHT_GREY)
-                self.graphs.SetString(index, name + ' (disabled)')
+        self.graphs.Freeze()
+        try:
+            self.graphs.SetItems([name if enabled else name + ' (disabled)'
+                                  for name, enabled in self.graphData])
+            for index, (_, enabled) in enumerate(self.graphData):
+                if not enabled:
+                    self.graphs.SetItemForegroundColour(index, wx.LIGHT_GREY)
+        finally:
+            self.graphs.Thaw()
 
         num = len(self.graphData)
         if num > 0:
@@ -1430,7 +1582,7 @@ class GraphFrame(wx.Frame):
     def updateButtonEnabled(self):
         """Enable or disable buttons based on current selection."""
         isel = self.graphs.GetSelection()
-        if 0 <= isel < len(self.graphs.GetItems()):
+        if 0 <= isel < self.graphs.GetCount():
             self.btnEdit.Enable(True)
             self.btnRemove.Enable(True)
         else:
@@ -1439,9 +1591,7 @@ class GraphFrame(wx.Frame):
 
     def checkAbility(self):
         """Return whether there are enough columns to create a graph."""
-        columnNames = self.experiment.getStorageBinNames()[1]
-
-        if len(columnNames) < 2:
+        if self.experiment.getColumnCount() < 2:
             wx.MessageBox(('A graph cannot be created at this time. '
                            'You must have at least two columns '
                            'defined in order to graph things.'),
@@ -1508,6 +1658,7 @@ class ConstantFrame(wx.Frame):
         self.btnRemove.Enable(False)
         self.btnSet.Enable(False)
         self.btnClear.Enable(False)
+        self._lastEditState = None
 
         mainpanel.add(listpanel, 1, wx.EXPAND | wx.ALL, 0)
         mainpanel.add(settingspanel, 0, wx.EXPAND | wx.ALL, 0)
@@ -1525,13 +1676,14 @@ class ConstantFrame(wx.Frame):
 
     def populate(self):
         """Read the constants (names and values) from the experiment."""
-        self.constants.DeleteAllItems()
         constants = self.experiment.getAllConstants()
-        for currentName in constants:
-            currentValue = str(constants[currentName])
-            position = self.constants.GetItemCount()
-            self.constants.InsertStringItem(position, currentName)
-            self.constants.SetStringItem(position, 1, currentValue)
+        self.constants.Freeze()
+        try:
+            self.constants.DeleteAllItems()
+            for currentName, currentValue in constants.items():
+                self.constants.Append([currentName, str(currentValue)])
+        finally:
+            self.constants.Thaw()
 
     def executeSuccessActions(self):
         """Execute any success actions which have been defined."""
@@ -1540,15 +1692,13 @@ class ConstantFrame(wx.Frame):
 
     def onAdd(self, event):
         """Add a new constant with the entered name and value."""
-        if not self.name.GetValue() or not self.value.GetValue():
-            return
-        if self.checkValue() > 0:
-            return
-        numItems = self.constants.GetItemCount()
         newName = self.name.GetValue()
         newValue = self.value.GetValue()
-        self.constants.InsertStringItem(numItems, newName)
-        self.constants.SetStringItem(numItems, 1, newValue)
+        if not newName or not newValue:
+            return
+        if self.checkValue(newName, newValue) > 0:
+            return
+        self.constants.Append([newName, newValue])
 
         self.experiment.setConstant(newName, float(newValue))
         self.name.Clear()
@@ -1558,6 +1708,7 @@ class ConstantFrame(wx.Frame):
         self.btnSet.Enable(False)
         self.btnRemove.Enable(False)
         self.btnClear.Enable(False)
+        self._lastEditState = None
         self.executeSuccessActions()
 
     def onRemove(self, event):
@@ -1567,14 +1718,12 @@ class ConstantFrame(wx.Frame):
         self.constants.DeleteItem(index)
         self.name.SetValue("")
         self.value.SetValue("")
-        self.btnAdd.Disable()
-        self.btnRemove.Disable()
-        self.btnSet.Disable()
         self.deselectAll()
         self.btnAdd.Enable(False)
         self.btnSet.Enable(False)
         self.btnRemove.Enable(False)
         self.btnClear.Enable(False)
+        self._lastEditState = None
         self.executeSuccessActions()
 
     def onClear(self, event):
@@ -1585,46 +1734,63 @@ class ConstantFrame(wx.Frame):
         self.btnSet.Enable(False)
         self.btnRemove.Enable(False)
         self.deselectAll()
+        self._lastEditState = None
 
     def onSave(self, event):
         """Save the value if it is legitimate."""
-        if not self.name.GetValue() or not self.value.GetValue():
+        newName = self.name.GetValue()
+        newValue = self.value.GetValue()
+        if not newName or not newValue:
             return
-        if self.checkValue() > 0:
+        if self.checkValue(newName, newValue) > 0:
             return
         index = self.constants.GetFocusedItem()
-        newName = self.name.GetValue()
-        newValue = self.value.GetValue()
         self.experiment.setConstant(newName, float(newValue))
-        self.constants.DeleteItem(index)
-        self.constants.InsertStringItem(index, newName)
-        self.constants.SetStringItem(index, 1, newValue)
+        self.constants.Freeze()
+        try:
+            self.constants.SetItemText(index, newName)
+            self.constants.SetItem(index, 1, newValue)
+            self.deselectAll()
+        finally:
+            self.constants.Thaw()
         self.name.Clear()
         self.value.Clear()
-        self.deselectAll()
         self.btnAdd.Enable(False)
         self.btnSet.Enable(False)
         self.btnRemove.Enable(False)
         self.btnClear.Enable(False)
+        self._lastEditState = None
         self.executeSuccessActions()
 
     def deselectAll(self):
         """Deselect all items in the list."""
-        for index in range(self.constants.GetItemCount()):
-            self.constants.Select(index, False)
+        self.constants.SetItemState(-1, 0, wx.LIST_STATE_SELECTED)
 
     def onEdit(self, event):
-        """Update buttons based on the contents of the controls."""
+        """Update buttons based on the contents of the controls.
+        
+        The buttons are only touched when the edit changes which of them
+        should be enabled. Handlers which set the buttons directly reset
+        `_lastEditState` so that the next edit is applied in full.
+        """
+        name = self.name.GetValue()
+        hasName = len(name) > 0
+        hasValue = len(self.value.GetValue()) > 0
+        exists = (hasName and hasValue and
+                  self.experiment.getConstant(name) is not None)
+        state = (hasName, hasValue, exists)
+        if state == self._lastEditState:
+            return
+        self._lastEditState = state
+
         self.btnRemove.Enable(False)
-        nameLength = len(self.name.GetValue())
-        valueLength = len(self.name.GetValue())
-        if nameLength == valueLength == 0:
+        if not hasName and not hasValue:
             self.btnClear.Enable(False)
-        elif nameLength == 0 or valueLength == 0:
+        elif not hasName or not hasValue:
             self.btnAdd.Disable()
             self.btnSet.Disable()
             self.btnClear.Enable(True)
-        elif self.experiment.getConstant(self.name.GetValue()) is not None:
+        elif exists:
             self.btnAdd.Disable()
             self.btnSet.Enable()
             self.btnClear.Enable(True)
@@ -1635,8 +1801,8 @@ class ConstantFrame(wx.Frame):
 
     def onSelection(self, event):
         """Update buttons and values as the list selection changes."""
-        if self.constants.GetFocusedItem() >= 0:
-            index = self.constants.GetFocusedItem()
+        index = self.constants.GetFocusedItem()
+        if index >= 0:
             selectedName = self.constants.GetItemText(index)
             self.name.SetValue(selectedName)
             self.value.SetValue(str(self.experiment.getConstant(selectedName)))
@@ -1647,20 +1813,36 @@ class ConstantFrame(wx.Frame):
             self.btnRemove.Disable()
         self.btnAdd.Disable()
         self.btnSet.Disable()
+        self._lastEditState = None
 
-    def checkValue(self):
-        """Make sure the entered value is legitimate."""
+    def checkValue(self, name, value):
+        """Make sure the entered value is legitimate.
+        
+        Parameters
+        ----------
+        name : str
+            The name entered for the constant.
+        value : str
+            The value entered for the constant.
+        
+        Returns
+        -------
+        int
+            0 if the name and value are acceptable, or 1 otherwise.
+        """
         try:
-            float(self.value.GetValue())
+            float(value)
         except (TypeError, ValueError):
             wx.MessageBox('Constant value must be a number.', 'Error',
                           wx.OK | wx.ICON_ERROR)
             return 1
-        if re.match('[^a-zA-Z]', self.name.GetValue()):
+        if not name:
+            return 0
+        if not (name[0].isascii() and name[0].isalpha()):
             wx.MessageBox('Constant name must begin with a letter', 'Error',
                           wx.OK | wx.ICON_ERROR)
             return 1
-        if re.search('[^a-zA-Z0-9]', self.name.GetValue()):
+        if not (name.isascii() and name.isalnum()):
             wx.MessageBox('Constant name may not contain special characters.',
                           'Error', wx.OK | wx.ICON_ERROR)
             return 1
@@ -1,15 +1,14 @@
 """Tools for loading instrument controllers."""
 
-import imp
 import os
 import wx
 
 from src.tools import path_tools as pt
 
-_PREFER_COMPILED = False
-
 DIR = pt.unrel('src', 'gui', 'instruments')
 
+_CONTROLLERS = None
+
 class ControllerFrame(wx.Frame):
     """A frame for introspection."""
     MODEL = 'Unknown'
@@ -28,32 +27,29 @@ def _loadInstrumentControllers():
     controllers = {}
     data = pt.getSourceFiles(DIR)
     for modname in data:
-        fname = os.path.join(DIR, modname)
-        module = None
-        if _PREFER_COMPILED:
-            if data[modname]['.pyo']:
-                module = imp.load_compiled(modname, fname + '.pyo')
-            elif data[modname]['.pyc']:
-                module = imp.load_compiled(modname, fname + '.pyc')
-            elif data[modname]['.py']:
-                module = imp.load_source(modname, fname + '.py')
-        else:
-            if data[modname]['.py']:
-                module = imp.load_source(modname, fname + '.py')
-            elif data[modname]['.pyo']:
-                module = imp.load_compiled(modname, fname + '.pyo')
-            elif data[modname]['.pyc']:
-                module = imp.load_compiled(modname, fname + '.pyc')
-                
-        if module is None:
+        if not data[modname]['.py']:
             continue
-        
-        for item in module.__dict__:
-            curr = getattr(module, item)
+        module = pt.loadModule(modname, os.path.join(DIR, modname + '.py'))
+
+        # Each controller module defines a single controller frame
+        for curr in vars(module).values():
             if (isinstance(curr, type) and 
                     curr is not ControllerFrame and
                     issubclass(curr, ControllerFrame)):
                 controllers[curr.MODEL] = curr
+                break
     return controllers
 
-INSTRUMENT_CONTROLLERS = _loadInstrumentControllers()
\ No newline at end of file
+def getInstrumentControllers():
+    """Return the instrument controllers, loading them on first use.
+    
+    Returns
+    -------
+    dict
+        A dictionary in which the keys are the names of the various instruments
+        and the values are the graphical controller frame objects.
+    """
+    global _CONTROLLERS
+    if _CONTROLLERS is None:
+        _CONTROLLERS = _loadInstrumentControllers()
+    return _CONTROLLERS
@@ -1,42 +1,68 @@
 """A loader and filter system for premade experiments.
 """
-import imp
+from collections import defaultdict
 import os
-import re
 import wx
 
 from src.tools import path_tools as pt
 
+_MANAGER = None
+
+def getPremadeManager():
+    """Return the shared premade manager, creating it on first use.
+    
+    Returns
+    -------
+    PremadeManager
+        The manager holding the premades loaded from the premades folder.
+    """
+    global _MANAGER
+    if _MANAGER is None:
+        _MANAGER = PremadeManager()
+    return _MANAGER
+
 class PremadeManager(object):
     """A class for managing and filtering premade experiments."""
     
     def __init__(self):
+        self.refresh()
+
+    def refresh(self):
+        """Reload the premades from their folder and rebuild the filters."""
         self.premades = _loadPremades()
-        self.measurementTypes = ['All']
-        self.devices = ['All']
-        self.voltageModes = ['All']
-        self.cryostats = ['All']
+        self._indices = (defaultdict(set), defaultdict(set),
+                         defaultdict(set), defaultdict(set))
+        self._filterCache = {}
         
-        for premade in self.premades:
-            info = self.premades[premade]
-            
-            currType = info['measurement_type']
-            currCryostat = info['cryostat']
-            currVoltage = info['voltage_type']
-            currDevices = info['devices']
+        for key, info in self.premades.items():
+            self._addToIndices(key, info)
 
-            for item in currType:
-                if item not in self.measurementTypes:
-                    self.measurementTypes.append(item)
-            for item in currCryostat:
-                if item not in self.cryostats:
-                    self.cryostats.append(item)
-            for item in currVoltage:
-                if item not in self.voltageModes:
-                    self.voltageModes.append(item)
-            if str(currDevices) not in self.devices:
-                self.devices.append(str(currDevices))
+        # The indices are keyed by filter value in order of first appearance
+        typeIndex, cryostatIndex, voltageIndex, devicesIndex = self._indices
+        self.measurementTypes = ['All'] + list(typeIndex)
+        self.cryostats = ['All'] + list(cryostatIndex)
+        self.voltageModes = ['All'] + list(voltageIndex)
+        self.devices = ['All'] + list(devicesIndex)
+        
+    def _addToIndices(self, key, info):
+        """Record a premade under each of its filter values.
         
+        Parameters
+        ----------
+        key : str
+            The key of the premade in `self.premades`.
+        info : dict
+            The information dictionary of the premade.
+        """
+        typeIndex, cryostatIndex, voltageIndex, devicesIndex = self._indices
+        for item in info['measurement_type']:
+            typeIndex[item].add(key)
+        for item in info['cryostat']:
+            cryostatIndex[item].add(key)
+        for item in info['voltage_type']:
+            voltageIndex[item].add(key)
+        devicesIndex[str(info['devices'])].add(key)
+
     def getFiltered(self, measurementType, cryostat, voltageMode, devices):
         """Return the items which pass through the filtering parameters.
         
@@ -64,19 +90,24 @@ class PremadeManager(object):
             element is a list of classes corresponding to the names in the
             first list.
         """
-        classes = []
-        names = []
-        for premadeKey in self.premades:
-            premade = self.premades[premadeKey]
-            if ((measurementType == 'All' or 
-                 measurementType in premade['measurement_type']) and
-                (cryostat == 'All' or cryostat in premade['cryostat']) and
-                (devices == 'All' or str(premade['devices']) == devices) and
-                (voltageMode == 'All' or 
-                 voltageMode in premade['voltage_type'])):
-                classes.append(premade['class'])
-                names.append(premade['name'])
-        return (names, classes)
+        filters = (measurementType, cryostat, voltageMode, devices)
+        if filters not in self._filterCache:
+            keys = None
+            for value, index in zip(filters, self._indices):
+                if value == 'All':
+                    continue
+                matches = index.get(value, set())
+                keys = matches if keys is None else keys & matches
+            if keys is None:
+                premades = list(self.premades.values())
+            else:
+                premades = [premade for key, premade in self.premades.items()
+                            if key in keys]
+            self._filterCache[filters] = (
+                    [premade['name'] for premade in premades],
+                    [premade['class'] for premade in premades])
+        names, classes = self._filterCache[filters]
+        return (list(names), list(classes))
     
     def getStrings(self):
         """Return a list of strings representing possible filter values.
@@ -141,7 +172,7 @@ class PremadeFrame(wx.Dialog):
         super(PremadeFrame, self).__init__(parent, wx.ID_ANY, 
                                            title='Premade Experiments')
         self.parent = parent
-        self.premadeManager = PremadeManager()
+        self.premadeManager = getPremadeManager()
         strings = self.premadeManager.getStrings()
         self.names, self.classes = self.premadeManager.getFiltered('All', 'All',
                                                                    'All', 'All')
@@ -252,29 +283,29 @@ def _loadPremades():
             devides : int
                 The number of devices to be measured.
     """
-    pattern = re.compile(r'class *([\w_]+) *\( *[\w_\.]* *\) *:')
     premadeFolder = pt.unrel('src', 'premades')
     allData = {}
     
     def _importModule(moduleName):
         """Import the module and record the data."""
         fileName = pt.unrel('src', 'premades', moduleName)
-        with open(fileName + '.py') as moduleFile:
-            data = moduleFile.read()
-            match = pattern.search(data)
-        loadedModule = imp.load_source(moduleName, fileName + '.py')
-        if hasattr(loadedModule, 'INFORMATION') and match is not None:
-            className = match.group(1)
-            information = getattr(loadedModule, 'INFORMATION')
+        loadedModule = pt.loadModule(moduleName, fileName + '.py')
+        information = getattr(loadedModule, 'INFORMATION', None)
+        if information is None:
+            return
+        premadeClass = next((value for value in vars(loadedModule).values()
+                             if isinstance(value, type) and
+                             value.__module__ == moduleName), None)
+        if premadeClass is not None:
             allData[moduleName] = information
-            allData[moduleName]['class'] = getattr(loadedModule, className)
+            allData[moduleName]['class'] = premadeClass
             
-    for item in os.walk(premadeFolder):
-        fnames = item[2]
-        for fname in fnames:
-            if fname.endswith('.py') and not fname.startswith('__init__'):
-                currentModule = fname[:-3]
-                _importModule(currentModule)
+    with os.scandir(premadeFolder) as entries:
+        for entry in entries:
+            fname = entry.name
+            if (fname.endswith('.py') and not fname.startswith('__init__') and
+                    entry.is_file()):
+                _importModule(fname[:-3])
 
     return allData
     
@@ -1,11 +1,17 @@
 """A frame for displaying experiment status information."""
 
 # pylint: disable=C0103,W0231
+from collections import deque
+import threading
 import wx
 from wx.lib.newevent import NewEvent
 
 from src.tools.general import Command
 
+_FLUSH_DELAY = 50
+_MAX_LOG_LINES = 5000
+_LOG_SLACK = 1000
+
 class StatusMonitorFrame (wx.Frame):
     """A frame for monitoring the experiment's status in real time.
     
@@ -33,6 +39,9 @@ class StatusMonitorFrame (wx.Frame):
         mainsizer.Add(self.pastLog, 1, wx.EXPAND|wx.TOP|wx.LEFT|wx.RIGHT, 5)
         mainsizer.Add(self.current, 0, wx.EXPAND|wx.BOTTOM|wx.LEFT|wx.RIGHT, 5)
         self.current.SetMinSize((-1, 50))
+        self._pending = []
+        self._flushTimer = None
+        self._logLines = deque(maxlen=_MAX_LOG_LINES)
         
         outersizer = wx.BoxSizer(wx.VERTICAL)
         outersizer.Add(mainpanel, 1, wx.EXPAND)
@@ -41,8 +50,9 @@ class StatusMonitorFrame (wx.Frame):
         self.Bind(self.EVT_UPDATE, self._onUpdate)
         self.Bind(self.EVT_POST, self._onPost)
         
-        updateCommand = UpdateCommand(self.UpdateEvent, self)
-        postCommand = UpdateCommand(self.PostEvent, self)
+        updateCommand = UpdateCommand(self.UpdateEvent, self, coalesce=True)
+        postCommand = UpdateCommand(self.PostEvent, self,
+                                    supersedes=updateCommand)
         
         monitor.setCommands([updateCommand], [postCommand])
         
@@ -53,25 +63,109 @@ class StatusMonitorFrame (wx.Frame):
     def _onPost(self, event):
         """Respond to a post."""
         self.current.SetValue('')
-        self.pastLog.Append(event.data)
+        self._pending.append(event.data)
+        if self._flushTimer is None:
+            self._flushTimer = wx.CallLater(_FLUSH_DELAY, self._flushLog)
+
+    def _flushLog(self):
+        """Append all posts received since the last flush to the log."""
+        self._flushTimer = None
+        if not self or not self._pending:
+            return
+        self._logLines.extend(self._pending)
+        self.pastLog.Freeze()
+        try:
+            # Let the log overrun its limit by some slack before trimming, so
+            # that it is rebuilt only once every _LOG_SLACK lines.
+            if (self.pastLog.GetCount() + len(self._pending) >
+                    _MAX_LOG_LINES + _LOG_SLACK):
+                self.pastLog.Set(list(self._logLines))
+            else:
+                self.pastLog.Append(self._pending)
+        finally:
+            self.pastLog.Thaw()
         self.pastLog.EnsureVisible(self.pastLog.GetCount()-1)
+        self._pending = []
         
     def _onClose(self, event):
         """Hide the frame."""
         self.Show(False)
 
 class UpdateCommand(Command):
-    """A Command subclass for updating the status monitor data."""
+    """A Command subclass for updating the status monitor data.
     
-    def __init__(self, eventClass, window):
+    Parameters
+    ----------
+    eventClass : class
+        The event class used to deliver the data to `window`.
+    window : wxWindow
+        The window which should receive the events.
+    coalesce : bool
+        Whether updates arriving faster than the GUI handles them should be
+        collapsed so that only the most recent one is delivered. This is
+        appropriate where each update replaces the previous one, but not
+        where every message must be kept.
+    supersedes : UpdateCommand
+        A coalescing command whose undelivered update is made obsolete by
+        each event from this command. That update is discarded, so that it
+        cannot be delivered after this command's event.
+        
+    Notes
+    -----
+    All events are delivered through `wx.CallAfter`, so that events from
+    different commands reach the window in the order in which they were sent.
+    """
+    
+    def __init__(self, eventClass, window, coalesce=False, supersedes=None):
         self.eventClass = eventClass
         self.window = window
+        self.coalesce = coalesce
+        self.supersedes = supersedes
+        self._lock = threading.Lock()
+        self._latest = None
+        self._pending = None
         
     def execute(self, *args, **kwargs):
         if 'currentMessage' in kwargs:
             data = kwargs['currentMessage']
         else:
             data = kwargs['postedMessage']
-        evt = self.eventClass(data=data)
-        wx.PostEvent(self.window, evt)
-        
\ No newline at end of file
+        if self.supersedes is not None:
+            self.supersedes.discardPending()
+        if not self.coalesce:
+            wx.CallAfter(self._send, data)
+            return
+        with self._lock:
+            self._latest = data
+            if self._pending is not None:
+                return
+            self._pending = token = object()
+        wx.CallAfter(self._deliver, token)
+        
+    def discardPending(self):
+        """Drop the coalesced update which has not yet been delivered."""
+        with self._lock:
+            self._latest = None
+            self._pending = None
+        
+    def _deliver(self, token):
+        """Send the most recent coalesced update to the window.
+        
+        Parameters
+        ----------
+        token : object
+            The marker of the update for which this delivery was scheduled. If
+            that update has since been discarded, nothing is sent.
+        """
+        with self._lock:
+            if token is not self._pending:
+                return
+            data, self._latest = self._latest, None
+            self._pending = None
+        self._send(data)
+        
+    def _send(self, data):
+        """Have the window handle an event carrying `data`."""
+        if self.window:
+            self.window.GetEventHandler().ProcessEvent(
+                                                self.eventClass(data=data))
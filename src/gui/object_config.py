@@ -1,6 +1,6 @@
 """Dialogs for setting up the main objects: actions, instruments, and graphs."""
 
-from functools import partial
+from functools import lru_cache, partial
 import os
 import wx
 
@@ -19,25 +19,30 @@ SUB_CONSTANT = experiment.SUB_CONSTANT
 SUB_COLUMN = experiment.SUB_COLUMN
 SUB_PARAMETER = experiment.SUB_PARAMETER
 
+# Bound formatters for the substitution templates, which never change
+_FORMAT_CONSTANT = SUB_CONSTANT.__mod__
+_FORMAT_COLUMN = SUB_COLUMN.__mod__
+_FORMAT_PARAMETER = SUB_PARAMETER.__mod__
+
 FILE_DIRECTIONS = ('Choose a folder to store data files using the "Browse for '
                    'Folder" button, and enter a filename for the current data '
                    'file, without any extensions.')
 
-CALCULATE_DIRECTIONS = (('Enter an expression. Expressions may include the '
+CALCULATE_DIRECTIONS = ('Enter an expression. Expressions may include the '
         'standard mathematical functions and any constants, parameters, or '
         'columns you have defined. Names of constants should be specified in '
-        'the form %s(constant name), parameters in the form %s(parameter name) '
-        'and columns in the form %s(column name).') %
-        (MARK_CONSTANT, MARK_PARAM, MARK_COLUMN))
+        f'the form {MARK_CONSTANT}(constant name), parameters in the form '
+        f'{MARK_PARAM}(parameter name) and columns in the form '
+        f'{MARK_COLUMN}(column name).')
 
-CONDITIONAL_DIRECTIONS = (('Enter a boolean expression (an expression that '
+CONDITIONAL_DIRECTIONS = ('Enter a boolean expression (an expression that '
         'evaluates to true or false). The expression may include any constants '
         'columns, or parameters you have defined, the basic operations (+, -, '
         '*, /, **), the standard mathematical functions, and the standard '
         'comparison operators (==, >, >=, <, <=, !=). Names of constants '
-        'should be specified in the form %s(constant name), parameters in the '
-        'form %s(parameter name) and columns in the form %s(column name).') %
-        (MARK_CONSTANT, MARK_PARAM, MARK_COLUMN))
+        f'should be specified in the form {MARK_CONSTANT}(constant name), '
+        f'parameters in the form {MARK_PARAM}(parameter name) and columns in '
+        f'the form {MARK_COLUMN}(column name).')
 
 
 # Dialog Dispatcher ------------------------------------------------------------
@@ -54,36 +59,25 @@ def getDialog(action):
     -------
     class
         The appropriate dialog class (uninstantiated) for modifying `action`.
+    
+    Notes
+    -----
+    The result is stored on the action as `_dialogClass`, so that later
+    calls for the same action return immediately. `Action.setInstrument`
+    discards it, since the dialog may depend on the instrument.
     """
-    result = None
-    if isinstance(action, act.ActionScan):
-        result = ScanDialog
-    elif (isinstance(action, act.ActionLoopTimed) or
-                    isinstance(action, act.ActionLoopIterations)):
-        result = LoopTimesDialog
-    elif isinstance(action, act.ActionLoopWhile):
-        result = LoopWhileDialog
-    elif (isinstance(action, act.ActionLoopUntilInterrupt) or
-                    isinstance(action, act.ActionSimultaneous) or
-                    isinstance(action, act.ActionContainer)):
-        result = BlankDialog
-    elif isinstance(action, act.Action):
-        instname = action.getInstrumentName()
-        actdesc = action.getDescription()
-        if instname == 'System':
-            if actdesc == 'Set data file':
-                result = FileDialog
-            elif actdesc == 'Calculate':
-                result = CalculateDialog
-            else:
-                result = ActionDialog
-        elif instname == 'Postprocessor':
-            result = BlankDialog        
-        else:
-            result = ActionDialog
-
+    result = getattr(action, '_dialogClass', None)
     if result is not None:
         return result
+    cls = type(action)
+    if isinstance(action, act.Action):
+        result = _resolveDialog(cls, action.getInstrumentName(),
+                                action.getDescription())
+    else:
+        result = _resolveDialog(cls, None, None)
+    if result is not None:
+        action._dialogClass = result
+        return result
 
     className = action.__class__.__name__
     myself = os.path.abspath( __file__ )
@@ -91,6 +85,40 @@ def getDialog(action):
                                'with this class of actions. Please edit ' +
                                'the dispatcher at %s') % (className, myself))
 
+@lru_cache(maxsize=128)
+def _resolveDialog(cls, instname, actdesc):
+    """Return the dialog class for an action class, instrument, and description.
+    
+    The result depends only on the arguments, so it is cached.
+    
+    Parameters
+    ----------
+    cls : class
+        The class of the action.
+    instname : str
+        The name of the action's instrument, or `None` if `cls` is not an
+        `Action` subclass.
+    actdesc : str
+        The description of the action, or `None` if `cls` is not an `Action`
+        subclass.
+    
+    Returns
+    -------
+    class
+        The dialog class for the action, or `None` if there is none.
+    """
+    # Walk the MRO so that subclasses resolve as they would with isinstance
+    for base in cls.__mro__:
+        if base in _DIALOGS_BY_CLASS:
+            return _DIALOGS_BY_CLASS[base]
+    if issubclass(cls, act.Action):
+        if instname == 'System':
+            return _SYSTEM_DIALOGS.get(actdesc, ActionDialog)
+        elif instname == 'Postprocessor':
+            return BlankDialog
+        return ActionDialog
+    return None
+
 
 # Action Configuration Dialogs -------------------------------------------------
 
@@ -115,65 +143,65 @@ class ActionDialog(gh.BaseDialog):
     def __init__(self, parent, expt, actionIn):
         self.experiment = expt
         self.action = actionIn
-        self.inputs = self.action.getInputProperties()
         self.outputs = self.action.getOutputProperties()
 
         super(ActionDialog, self).__init__(parent, wx.ID_ANY,
                                            self.action.getDescription(),
                                            minWidth=650)
+        # Suspend redrawing while the rows for each parameter are added
+        self.Freeze()
+        try:
+            mainpanel = gh.Panel(self, 'horizontal')
+
+            columnFlag = wx.ALIGN_CENTER_HORIZONTAL|wx.ALIGN_CENTER_VERTICAL
+            (descriptions, columns,
+             values, allowedValues) = self.action.getInputPropertyLists()
+            self.inputcols = []
+            self.inputvals = []
+            self.outputcols = []
+
+            inputpanel = gh.Panel(mainpanel, 'flex_grid', 'Inputs',
+                                  len(descriptions)+1, 3, 5, 5,
+                                  scrolling=True)
+            inputpanel.addLabel('Parameter', 0, columnFlag)
+            inputpanel.addLabel('Column Name', 0, columnFlag)
+            inputpanel.addLabel('Value', 0, columnFlag)
+            inputpanel.addGrowableColumn(1, 1)
+            inputpanel.addGrowableColumn(2, 1)
+
+            for currentLabel, column, value, allowed in zip(descriptions,
+                                                            columns, values,
+                                                            allowedValues):
+                currentControls = inputpanel.addLabeledMultiCtrl(
+                                    currentLabel, [column, value],
+                                    [None, allowed], 0)
+                self.inputcols.append(currentControls[0])
+                self.inputvals.append(currentControls[1])
+
+            outputpanel = gh.Panel(mainpanel, 'flex_grid', 'Outputs',
+                                   len(self.outputs)+1, 2, 5, 5,
+                                   scrolling=True)
+            outputpanel.addLabel('Parameter', 0, columnFlag)
+            outputpanel.addLabel('Column Name', 0, columnFlag)
+            outputpanel.addGrowableColumn(1, 1)
 
-        mainpanel = gh.Panel(self, 'horizontal')
+            for dat in self.outputs:
+                currCol = outputpanel.addLabeledText(dat['description'],
+                                                     dat['column'])
+                self.outputcols.append(currCol)
 
-        columnFlag = wx.ALIGN_CENTER_HORIZONTAL|wx.ALIGN_CENTER_VERTICAL
-        self.controls = []
-        self.inputcols = []
-        self.inputvals = []
-        self.outputcols = []
+            mainpanel.add(inputpanel, 3, wx.EXPAND|wx.ALL, 2)
+            mainpanel.add(outputpanel, 2, wx.EXPAND|wx.ALL, 2)
 
-        inputpanel = gh.Panel(mainpanel, 'flex_grid', 'Inputs',
-                                   len(self.inputs)+1, 3, 5, 5,
-                                   scrolling=True)
-        inputpanel.addLabel('Parameter', 0, columnFlag)
-        inputpanel.addLabel('Column Name', 0, columnFlag)
-        inputpanel.addLabel('Value', 0, columnFlag)
-        inputpanel.addGrowableColumn(1, 1)
-        inputpanel.addGrowableColumn(2, 1)
-
-        for dat in self.inputs:
-            currentLabel = dat['description']
-            choices = [None, dat['allowed']]
-            initialValues = [dat['column'], dat['value']]
-            currentControls = inputpanel.addLabeledMultiCtrl(currentLabel,
-                                                             initialValues,
-                                                             choices, 0)
-            self.inputcols.append(currentControls[0])
-            self.inputvals.append(currentControls[1])
-
-        outputpanel = gh.Panel(mainpanel, 'flex_grid', 'Outputs',
-                                    len(self.outputs)+1, 2, 5, 5,
-                                    scrolling=True)
-        outputpanel.addLabel('Parameter', 0, columnFlag)
-        outputpanel.addLabel('Column Name', 0, columnFlag)
-        outputpanel.addGrowableColumn(1, 1)
-
-        for dat in self.outputs:
-            currCol = outputpanel.addLabeledText(dat['description'],
-                                                 dat['column'])
-            self.outputcols.append(currCol)
-
-        mainpanel.add(inputpanel, 3, wx.EXPAND|wx.ALL, 2)
-        mainpanel.add(outputpanel, 2, wx.EXPAND|wx.ALL, 2)
-
-        mainpanel.SetMinSize((600, 200))
-        self.setPanel(mainpanel)
+            mainpanel.SetMinSize((600, 200))
+            self.setPanel(mainpanel)
+        finally:
+            self.Thaw()
 
     def update(self):
         """Try to update the action to reflect changes made by this dialog."""
-        newincols = []
-        newinvals = []
-        for col, val in zip(self.inputcols, self.inputvals):
-            newincols.append(col.GetValue())
-            newinvals.append(val.GetValue())
+        newincols = [col.GetValue() for col in self.inputcols]
+        newinvals = [val.GetValue() for val in self.inputvals]
         try:
             self.action.setInputValues(newinvals)
             self.action.setInputColumns(newincols)
@@ -183,9 +211,8 @@ class ActionDialog(gh.BaseDialog):
             dialog.ShowModal()
             return False
 
-        newoutcols = []
-        for col in self.outputcols:
-            newoutcols.append(col.GetValue())
+        newoutcols = [col.GetValue() for col in self.outputcols]
+        self.action.setOutputColumns(newoutcols)
         return True
 
 
@@ -278,7 +305,8 @@ class LoopTimesDialog(gh.BaseDialog):
 
         mainpanel = gh.Panel(self, 'horizontal')
 
-        if isinstance(self.action, act.ActionLoopTimed):
+        self.isTimed = isinstance(self.action, act.ActionLoopTimed)
+        if self.isTimed:
             self.label = 'Loop time (s): '
             self.value = self.action.getDuration()
         else:
@@ -294,15 +322,18 @@ class LoopTimesDialog(gh.BaseDialog):
         """Try to update the action to reflect changes made by this dialog."""
         val = self.valueBox.GetValue()
 
-        if isinstance(self.action, act.ActionLoopTimed):
+        if self.isTimed:
             self.action.setDuration(float(val))
         else:
             self.action.setIterations(int(val))
         return True
 
 
-class BlankDialog(gh.BaseDialog):
-    """An empty dialog which closes immediately.
+class BlankDialog(object):
+    """A stand-in for actions which have nothing to configure.
+
+    It provides the parts of the dialog interface which callers use, but
+    creates no window, so `ShowModal` returns immediately.
 
     Parameters
     ----------
@@ -314,21 +345,21 @@ class BlankDialog(gh.BaseDialog):
         The action whose parameters will be set by this dialog.
     """
     def __init__(self, parent, expt, actionIn):
-        super(BlankDialog, self).__init__(parent, -1)
-
+        self.parent = parent
         self.experiment = expt
         self.action = actionIn
 
     def close(self):
         """Close the dialog."""
-        self.EndModal(wx.ID_OK)
-        self.Destroy()
+        pass
+
+    def Destroy(self):
+        """Do nothing, since there is no window to destroy."""
+        return True
 
-    # pylint: disable=W0221
-    def ShowModal(self, event=None):
-        """Return immediately, so that the dialog closes."""
+    def ShowModal(self):
+        """Return immediately, as though the user had accepted the dialog."""
         return wx.ID_OK
-    # pylint: enable=W0221
 
     def update(self):
         """Try to update the action to reflect changes made by this dialog."""
@@ -595,21 +626,24 @@ class ExpressionPanel(wx.Panel):
 
         self.constbox = wx.ListBox(constpanel)
         self.constbox.SetItems(data[0])
-        self.constbox.Bind(wx.EVT_LISTBOX_DCLICK, self.__insertConstant)
+        self.constbox.Bind(wx.EVT_LISTBOX_DCLICK,
+                           partial(self.__insert, _FORMAT_CONSTANT))
         constpanel.add(self.constbox, proportion=1, flag=wx.EXPAND)
 
         colpanel = gh.Panel(bottompanel, 'vertical', 'Columns')
 
         self.colbox = wx.ListBox(colpanel)
         self.colbox.SetItems(data[1])
-        self.colbox.Bind(wx.EVT_LISTBOX_DCLICK, self.__insertColumn)
+        self.colbox.Bind(wx.EVT_LISTBOX_DCLICK,
+                         partial(self.__insert, _FORMAT_COLUMN))
         colpanel.add(self.colbox, proportion=1, flag=wx.EXPAND)
 
         parampanel = gh.Panel(bottompanel, 'vertical', 'Parameters')
 
         self.parambox = wx.ListBox(parampanel)
         self.parambox.SetItems(data[2])
-        self.parambox.Bind(wx.EVT_LISTBOX_DCLICK, self.__insertParameter)
+        self.parambox.Bind(wx.EVT_LISTBOX_DCLICK,
+                           partial(self.__insert, _FORMAT_PARAMETER))
         parampanel.add(self.parambox, proportion=1, flag=wx.EXPAND)
 
         bottomsizer.Add(constpanel, proportion=1, flag=wx.EXPAND)
@@ -645,32 +679,19 @@ class ExpressionPanel(wx.Panel):
         """
         self.exprbox.SetValue(expression)
 
-    def __insertConstant(self, event):
-        """Insert the name of the selected constant at the cursor position."""
-        val = self.exprbox.GetValue()
-        insertionPoint = self.exprbox.GetInsertionPoint()
-        pre = val[:insertionPoint]
-        post = val[insertionPoint:]
-        newString = SUB_CONSTANT % event.GetString()
-        self.exprbox.SetValue(''.join([pre, newString, post]))
-
-    def __insertColumn(self, event):
-        """Insert the name of the selected column at the cursor position."""
-        val = self.exprbox.GetValue()
-        insertionPoint = self.exprbox.GetInsertionPoint()
-        pre = val[:insertionPoint]
-        post = val[insertionPoint:]
-        newString = SUB_COLUMN % event.GetString()
-        self.exprbox.SetValue(''.join([pre, newString, post]))
-
-    def __insertParameter(self, event):
-        """Insert the name of the selected parameter at the cursor position."""
-        val = self.exprbox.GetValue()
-        insertionPoint = self.exprbox.GetInsertionPoint()
-        pre = val[:insertionPoint]
-        post = val[insertionPoint:]
-        newString = SUB_PARAMETER % event.GetString()
-        self.exprbox.SetValue(''.join([pre, newString, post]))
+    def __insert(self, formatter, event):
+        """Insert the selected name at the cursor position.
+        
+        Parameters
+        ----------
+        formatter : callable
+            A function which places a name into the appropriate substitution
+            template (one of `_FORMAT_CONSTANT`, `_FORMAT_COLUMN`, or
+            `_FORMAT_PARAMETER`).
+        event : wx.CommandEvent
+            The double-click event from the list box.
+        """
+        self.exprbox.WriteText(formatter(event.GetString()))
 
 
 # Instruments ------------------------------------------------------------------
@@ -684,40 +705,46 @@ class InstrumentDialog(gh.BaseDialog):
         super(InstrumentDialog, self).__init__(parent, wx.ID_ANY,
                                                title='Edit instrument',
                                                minWidth=300)
-
-        self.inst = inst
-        self.spec = inst.getSpecification()
-
-        setpanel = wx.Panel(self)
-        setsizer = wx.FlexGridSizer(len(self.spec) + 1, 2, 3, 3)
-        setpanel.SetSizer(setsizer)
-
-        name = self.inst.getName()
-
-        self.tbs = []
-        setsizer.Add(wx.StaticText(setpanel, label='Name:'), 0,
-                     wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL)
-        self.namefield = wx.TextCtrl(setpanel)
-        self.namefield.SetValue(name)
-        setsizer.Add(self.namefield, proportion=1, flag=wx.EXPAND)
-        self.controls = []
-        for item in self.spec:
-            itemLabel = wx.StaticText(setpanel, label=item.description + ':')
-            setsizer.Add(itemLabel, 0, wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL)
-            if item.allowed is None:
-                control = wx.TextCtrl(setpanel)
-            else:
-                control = wx.ComboBox(setpanel, style=wx.CB_DROPDOWN,
-                                      choices=item.allowed)
-
-            control.SetValue(str(item))
-            control.SetMinSize((200, -1))
-            self.controls.append(control)
-            setsizer.Add(control, 1, wx.EXPAND)
-
-        setsizer.AddGrowableCol(1, 1)
-
-        self.setPanel(setpanel)
+        # Suspend redrawing while the rows for each setting are added
+        self.Freeze()
+        try:
+            self.inst = inst
+            self.spec = inst.getSpecification()
+
+            setpanel = wx.Panel(self)
+            setsizer = wx.FlexGridSizer(len(self.spec) + 1, 2, 3, 3)
+            setpanel.SetSizer(setsizer)
+
+            name = self.inst.getName()
+
+            self.tbs = []
+            setsizer.Add(wx.StaticText(setpanel, label='Name:'), 0,
+                         wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL)
+            self.namefield = wx.TextCtrl(setpanel)
+            self.namefield.SetValue(name)
+            setsizer.Add(self.namefield, proportion=1, flag=wx.EXPAND)
+            self.controls = []
+            for item in self.spec:
+                itemLabel = wx.StaticText(setpanel,
+                                          label=item.description + ':')
+                setsizer.Add(itemLabel, 0,
+                             wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL)
+                if item.allowed is None:
+                    control = wx.TextCtrl(setpanel)
+                else:
+                    control = wx.ComboBox(setpanel, style=wx.CB_DROPDOWN,
+                                          choices=item.allowed)
+
+                control.SetValue(str(item))
+                control.SetMinSize((200, -1))
+                self.controls.append(control)
+                setsizer.Add(control, 1, wx.EXPAND)
+
+            setsizer.AddGrowableCol(1, 1)
+
+            self.setPanel(setpanel)
+        finally:
+            self.Thaw()
 
     def update(self):
         """Update the instrument to reflect changes."""
@@ -741,12 +768,10 @@ class RebindInstrumentDialog(gh.BaseDialog):
         self.inst = self.action.getInstrument()
         self.options = self.experiment.getEqualEnoughInstruments(action)
 
-        self.names = []
-        self.initindex = None
-        for index, option in enumerate(self.options):
-            self.names.append(option['instrument_name'])
-            if option['instrument'] is self.inst:
-                self.initindex = index
+        self.names = [option['instrument_name'] for option in self.options]
+        self.initindex = next((index for index, option
+                               in enumerate(self.options)
+                               if option['instrument'] is self.inst), None)
 
         instpanel = wx.Panel(self)
         instbox = wx.StaticBox(instpanel, wx.ID_ANY, "Instrument")
@@ -832,15 +857,32 @@ class GraphDialog(gh.BaseDialog):
         if self.trigbox.GetValue() == 'None':
             newcols[2] = None
         if self.graphIn is not None:
-            self.graphIn.setColumns(newcols)
-            self.experiment.updateGraphColumns(self.graphIn)
+            # Re-registering the columns rebuilds the graph, so skip it when
+            # the dialog was accepted without changes
+            if self.graphIn.getColumns() != tuple(newcols):
+                self.graphIn.setColumns(newcols)
+                self.experiment.updateGraphColumns(self.graphIn)
         else:
             self.graphIn = Graph(self.experiment, *newcols)
             self.experiment.addGraph(self.graphIn)
 
-        cols = self.experiment.getStorageBinNames()[1]
+        cols = self.columnNames
         if newcols[0] in cols and newcols[1] in cols:
             self.graphIn.setEnabled(True)
         else:
             self.graphIn.setEnabled(False)
         return True
+
+
+# Dispatch Tables --------------------------------------------------------------
+
+_DIALOGS_BY_CLASS = {act.ActionScan: ScanDialog,
+                     act.ActionLoopTimed: LoopTimesDialog,
+                     act.ActionLoopIterations: LoopTimesDialog,
+                     act.ActionLoopWhile: LoopWhileDialog,
+                     act.ActionLoopUntilInterrupt: BlankDialog,
+                     act.ActionSimultaneous: BlankDialog,
+                     act.ActionContainer: BlankDialog}
+
+_SYSTEM_DIALOGS = {'Set data file': FileDialog,
+                   'Calculate': CalculateDialog}
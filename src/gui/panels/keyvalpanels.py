@@ -4,6 +4,8 @@
 import wx
 from src.gui import gui_helpers as gh
 
+_UPDATE_DELAY = 50
+
 class KeyValPanel(wx.Panel):
     '''The `ScanPanel` is a graphical way of specifying the points at which an
     `ActionScan` should stop to execute its children.
@@ -26,14 +28,15 @@ class KeyValPanel(wx.Panel):
         
         self.data = initialData
         self.noDefault = noDefault
+        self._updateTimer = None
+        self._editDialog = None
 
         listpanel = wx.Panel(self, wx.ID_ANY)
         listsizer = wx.BoxSizer(wx.VERTICAL)
         listpanel.SetSizer(listsizer)
         
         self.list = gh.KeyValListCtrl(listpanel)
-        if len(self.data) > 0:
-            self.setData(self.data)
+        self.setData(self.data)
 
         listsizer.Add(self.list, proportion=1, flag=wx.EXPAND|wx.ALL, border=5)
 
@@ -59,6 +62,7 @@ class KeyValPanel(wx.Panel):
         self.navInsert.Bind(wx.EVT_BUTTON, self.onInsert)
         self.navRemove.Bind(wx.EVT_BUTTON, self.onRemove)
         self.list.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.onEdit)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self._onDestroy)
 
         mainsizer.Add(listpanel, proportion=1, flag=wx.EXPAND)
         mainsizer.Add(navpanel, proportion=0, flag=wx.ALL, border=3)
@@ -69,75 +73,110 @@ class KeyValPanel(wx.Panel):
 
     def onMoveUp(self, evt):
         index = self.list.GetFocusedItem()
-        if index > 0:
-            cpos = self.list.GetFocusedItem()
-            self.data.insert(cpos-1, self.data.pop(cpos))
-            self.setData(self.data)
-            self.list.Focus(cpos-1)
-            self.list.Select(cpos-1)
+        if 0 < index < len(self.data):
+            self.data[index-1], self.data[index] = (self.data[index],
+                                                    self.data[index-1])
+            self.list.refreshRows(index-1, index)
+            self.list.Focus(index-1)
+            self.list.Select(index-1)
         
         
     def onMoveDown(self, evt):
         index = self.list.GetFocusedItem()
-        if index < len(self.data)-1:
-            self.data.insert(index+1, self.data.pop(index))
-            self.setData(self.data)
+        if 0 <= index < len(self.data)-1:
+            self.data[index], self.data[index+1] = (self.data[index+1],
+                                                    self.data[index])
+            self.list.refreshRows(index, index+1)
             self.list.Focus(index+1)
             self.list.Select(index+1)
 
         
     def onAdd(self, evt):
         self.data.append(['', '', 'String'])
-        self.setData(self.data)
+        self.list.refreshRows(len(self.data)-1, len(self.data)-1)
         self.list.Focus(len(self.data)-1)
         self.list.Select(len(self.data)-1)
         self.onEdit(None)
+        self._scheduleUpdate()
 
     def onInsert(self, evt):
         cpos = self.list.GetFocusedItem()
+        if not 0 <= cpos < len(self.data):
+            cpos = len(self.data)
         self.data.insert(cpos, ['', '', 'String'])
-        self.setData(self.data)
+        self.list.refreshRows(cpos, len(self.data)-1)
         self.list.Focus(cpos)
         self.list.Select(cpos)
         self.onEdit(None)
-
-#         self.list.InsertStringItem(cpos, '')
-#         self.list.SetStringItem(cpos,1,'')
-#         self.list.SetStringItem(cpos,2,'')
-#         self.list.Focus(cpos)
-#         self.list.Select(cpos)
+        self._scheduleUpdate()
         
     def onRemove(self, evt):
         pos = self.list.GetFocusedItem()
+        if not 0 <= pos < len(self.data):
+            return
         del self.data[pos]
-        self.setData(self.data)
-        self.updateCommand(*self.updateArgs)
+        self.list.refreshRows(pos, len(self.data)-1)
+        self._scheduleUpdate()
         
     def onEdit(self, evt):
         pos = self.list.GetFocusedItem()
+        if not 0 <= pos < len(self.data):
+            return
         keyval = self.data[pos]
-        dialog = KeyValDialog(self, keyval, self.noDefault)
-        if dialog.ShowModal():
-            self.setData(self.data)
-            self.updateCommand(*self.updateArgs) 
+        if self._editDialog is None:
+            self._editDialog = KeyValDialog(self, keyval, self.noDefault)
+        else:
+            self._editDialog.setKeyval(keyval)
+        dialog = self._editDialog
+        if dialog.ShowModal() == wx.ID_OK and dialog.changed:
+            self.list.refreshRows(pos, pos)
+            self._scheduleUpdate()
 
     
     def setData(self, data):
+        self.flushUpdate()
         self.data = data
         self.list.setValues(data)
         
     def getData(self):
-        dat = []
-        for row in range(self.list.GetItemCount()):
-            c1 = self.list.GetItem(row,col=0).GetText()
-            c2 = self.list.GetItem(row,col=1).GetText()
-            c3 = self.list.GetItem(row,col=2).GetText()
-            dat.append( [c1,c2,c3] )
-        return dat
+        return [list(row) for row in self.data]
 
     def bindUpdateAction(self, command, args=()):
         self.updateCommand = command
         self.updateArgs = args
+        
+    def _scheduleUpdate(self):
+        """Run the update command once changes have stopped arriving."""
+        if self._updateTimer is None:
+            self._updateTimer = wx.CallLater(_UPDATE_DELAY, self._flushUpdate)
+        else:
+            self._updateTimer.Restart(_UPDATE_DELAY)
+            
+    def flushUpdate(self):
+        """Run a pending update command now instead of after the delay.
+        
+        This should be called before the owner changes the object to which
+        the update command applies, so that the pending changes are applied
+        to the object they were made for.
+        """
+        if self._updateTimer is not None:
+            self._updateTimer.Stop()
+            self._flushUpdate()
+            
+    def _flushUpdate(self):
+        """Run the update command for all changes since the last update."""
+        self._updateTimer = None
+        if self:
+            self.updateCommand(*self.updateArgs)
+            
+    def _onDestroy(self, event):
+        """Apply pending changes and destroy the reusable edit dialog."""
+        if event.GetEventObject() is self:
+            self.flushUpdate()
+            if self._editDialog:
+                self._editDialog.Destroy()
+                self._editDialog = None
+        event.Skip()
 
 class KeyValDialog(gh.BaseDialog):
     TYPES = ['Number', 'String', 'None']
@@ -151,8 +190,6 @@ class KeyValDialog(gh.BaseDialog):
         else:
             types = KeyValDialog.TYPES
             
-        self.keyval = keyval
-        
         mainpanel = gh.Panel(self, 'flex_grid', None, 3, 2, 5, 5)
         mainsizer = wx.BoxSizer(wx.VERTICAL)
         mainpanel.SetSizer(mainsizer)
@@ -174,19 +211,32 @@ class KeyValDialog(gh.BaseDialog):
                   wx.LEFT|wx.ALIGN_CENTER_VERTICAL|wx.ALIGN_RIGHT, 5)
         sizer.Add(self.type, 1, wx.RIGHT|wx.TOP|wx.BOTTOM|wx.EXPAND, 5)
         
-        self.name.SetValue(self.keyval[0])
-        self.val.SetValue(self.keyval[1])
-        self.type.SetValue(self.keyval[2])
+        self.setKeyval(keyval)
         
         mainsizer.Add(sizer, 1, wx.EXPAND|wx.ALL, 5)
         
         self.setPanel(mainpanel)
         
+    def setKeyval(self, keyval):
+        """Load a row into the dialog so that it can be shown again."""
+        self.keyval = keyval
+        self.changed = False
+        self.name.SetValue(self.keyval[0])
+        self.val.SetValue(self.keyval[1])
+        self.type.SetValue(self.keyval[2])
+        
+    def _onClose(self, event):
+        """End the dialog without destroying it, so that it can be reused."""
+        result = event.GetId()
+        if result != wx.ID_OK or self.update():
+            self.EndModal(result)
+        
     def update(self):
-        self.keyval[0] = self.name.GetValue()
-        self.keyval[1] = self.val.GetValue()
-        self.keyval[2] = self.type.GetValue()
-            
+        newKeyval = [self.name.GetValue(), self.val.GetValue(),
+                     self.type.GetValue()]
+        self.changed = list(self.keyval[:3]) != newKeyval
+        if self.changed:
+            self.keyval[:3] = newKeyval
         return True
     
         
\ No newline at end of file
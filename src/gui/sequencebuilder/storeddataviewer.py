@@ -4,6 +4,13 @@ MARK_CONSTANT = experiment.MARK_CONSTANT
 MARK_COLUMN = experiment.MARK_COLUMN
 MARK_PARAMETER = experiment.MARK_PARAMETER
 
+_DIRECTIONS = ('Enter an expression. Expressions may include the '
+        'standard mathematical functions and any constants, parameters, or '
+        'columns you have defined. Names of constants should be surrounded '
+        f'by {MARK_CONSTANT}s; Names of parameters should be surrounded '
+        f'by {MARK_PARAMETER}s; and names of columns should be surrounded '
+        f'by {MARK_COLUMN}s.')
+
 class CalculateDialog(wx.Dialog):
     def __init__(self, parent, experiment):
         super(CalculateDialog,self).__init__(parent)
@@ -14,82 +21,60 @@ class CalculateDialog(wx.Dialog):
         
     def __makeUi(self):
         
-        data = self.e.getStorageBinNames()
-        
-        directions = 'Enter an expression. Expressions may include the ' + \
-        'standard mathematical functions and any constants, parameters, or ' + \
-        'columns you have defined. Names of constants should be surrounded ' + \
-        'by ' + MARK_CONSTANT + 's; Names of parameters should be surrounded ' + \
-        'by ' + MARK_PARAMETER + 's; and names of columns should be surrounded ' + \
-        'by ' + MARK_COLUMN + 's.'
-        
-        dirpanel = wx.Panel(self)
-        dirsizer = wx.BoxSizer(wx.VERTICAL)
-        dirpanel.SetSizer(dirsizer)
-        
-        dirtext = wx.StaticText(dirpanel, label = directions)
-        dirtext.Wrap(self.GetSizeTuple()[0]*0.85)
-        dirsizer.Add(dirtext, flag=wx.ALL, border=5)
+        constants, columns, parameters = self.e.getStorageBinNames()
         
-        exprpanel = wx.Panel(self)
-        exprsizer = wx.StaticBoxSizer( wx.StaticBox( exprpanel, wx.ID_ANY, "Expression" ), wx.VERTICAL )
-        exprpanel.SetSizer(exprsizer)
+        # The static box sizers group the controls, so no intermediate panels
+        dirtext = wx.StaticText(self, label = _DIRECTIONS)
         
-        self.exprbox = wx.TextCtrl(wx.TE_MULTILINE)
+        exprsizer = wx.StaticBoxSizer( wx.StaticBox( self, wx.ID_ANY, "Expression" ), wx.VERTICAL )
+        self.exprbox = wx.TextCtrl(self, wx.ID_ANY, style=wx.TE_MULTILINE)
         exprsizer.Add(self.exprbox, proportion=1, flag=wx.EXPAND)
         
-        bottompanel = wx.Panel(self)
         bottomsizer = wx.BoxSizer(wx.HORIZONTAL)
-        bottompanel.SetSizer(bottomsizer)
         
-        constpanel = wx.Panel(bottompanel)
-        constsizer = wx.StaticBoxSizer( wx.StaticBox( constpanel, wx.ID_ANY, "Constants" ), wx.VERTICAL )
-        constpanel.SetSizer(constsizer)
-        
-        self.constbox = wx.ListBox(constpanel)
-        self.constbox.SetItems(data[0])
+        constsizer = wx.StaticBoxSizer( wx.StaticBox( self, wx.ID_ANY, "Constants" ), wx.VERTICAL )
+        self.constbox = wx.ListBox(self)
+        self.constbox.Freeze()
+        self.constbox.SetItems(constants)
+        self.constbox.Thaw()
         constsizer.Add(self.constbox, proportion=1, flag=wx.EXPAND)
-        bottomsizer.Add(constpanel)
-        
-        colpanel = wx.Panel(bottompanel)
-        colsizer = wx.StaticBoxSizer( wx.StaticBox( colpanel, wx.ID_ANY, "Columns" ), wx.VERTICAL )
-        colpanel.SetSizer(colsizer)
+        bottomsizer.Add(constsizer)
         
-        self.colbox = wx.ListBox(colpanel)
-        self.colbox.SetItems(data[1])
+        colsizer = wx.StaticBoxSizer( wx.StaticBox( self, wx.ID_ANY, "Columns" ), wx.VERTICAL )
+        self.colbox = wx.ListBox(self)
+        self.colbox.Freeze()
+        self.colbox.SetItems(columns)
+        self.colbox.Thaw()
         colsizer.Add(self.colbox, proportion=1, flag=wx.EXPAND)
-        bottomsizer.Add(colpanel)
+        bottomsizer.Add(colsizer)
         
-        parampanel = wx.Panel(bottompanel)
-        paramsizer = wx.StaticBoxSizer( wx.StaticBox( parampanel, wx.ID_ANY, "Parameters" ), wx.VERTICAL )
-        parampanel.SetSizer(paramsizer)
-        
-        self.parambox = wx.ListBox(parampanel)
-        self.parambox.SetItems(data[2])
+        paramsizer = wx.StaticBoxSizer( wx.StaticBox( self, wx.ID_ANY, "Parameters" ), wx.VERTICAL )
+        self.parambox = wx.ListBox(self)
+        self.parambox.Freeze()
+        self.parambox.SetItems(parameters)
+        self.parambox.Thaw()
         paramsizer.Add(self.parambox, proportion=1, flag=wx.EXPAND)
-        bottomsizer.Add(parampanel)
+        bottomsizer.Add(paramsizer)
         
-        bpanel = wx.Panel(self, wx.ID_ANY)
         bsizer = wx.BoxSizer(wx.HORIZONTAL)
-        bpanel.SetSizer(bsizer)
- 
-        self.btnOk = wx.Button(bpanel, wx.ID_OK, label="OK")
-        self.btnCancel = wx.Button(bpanel, wx.ID_CANCEL, label="Cancel", id=wx.ID_CANCEL)
+        self.btnOk = wx.Button(self, wx.ID_OK, label="OK")
+        self.btnCancel = wx.Button(self, wx.ID_CANCEL, label="Cancel")
         bsizer.Add(self.btnOk, proportion=0, flag=wx.ALL, border=5)
         bsizer.Add(self.btnCancel, proportion=0, flag=wx.ALL, border=5)
-        self.btnOk.Bind(wx.EVT_BUTTON, self.onClose)
-        self.btnCancel.Bind(wx.EVT_BUTTON, self.onClose)
         
         mainsizer = wx.BoxSizer(wx.VERTICAL)
-        mainsizer.Add(dirpanel, proportion=0, flag=wx.ALL, border=5)
-        mainsizer.Add(exprpanel, proportion=1, flag=wx.EXPAND|wx.ALL, border=5)
-        mainsizer.Add(bottompanel, proportion=1, flag=wx.EXPAND|wx.ALL, border=5)
-        mainsizer.Add(bpanel, proportion=0, flag=wx.ALL, border=5)
+        mainsizer.Add(dirtext, proportion=0, flag=wx.ALL, border=10)
+        mainsizer.Add(exprsizer, proportion=1, flag=wx.EXPAND|wx.ALL, border=5)
+        mainsizer.Add(bottomsizer, proportion=1, flag=wx.EXPAND|wx.ALL, border=5)
+        mainsizer.Add(bsizer, proportion=0, flag=wx.ALL, border=5)
         
         
-        self.AutoLayout(True)
+        self.SetAutoLayout(True)
         self.SetSizer(mainsizer)
         self.Layout()
+        # Wrap once the dialog has its real size, then lay out the result
+        dirtext.Wrap(int(self.GetClientSize().width*0.85))
+        self.Layout()
         
     def __addBindings(self):
         self.Bind(wx.EVT_CLOSE, self.__onClose)
@@ -1,9 +1,10 @@
 """Dialogs and panels for managing the system configuration."""
 
+import ast
+import functools
 import logging
 import re
-import wx.html
-import wx.adv
+import wx
 
 from src import about
 from src.core.configuration import c
@@ -15,6 +16,7 @@ log = logging.getLogger('transport')
 _USERNAME_ERROR_MESSAGE = ('Usernames may not contain special characters '
                            'except for underscores (spaces count as special '
                            'characters)')
+_USERNAME_RE = re.compile(r'[^a-zA-Z0-9_]')
 _NAME = about.APP_NAME
 _COPYRIGHT = '(C) 2013-2020 Thomas C. Flanagan'
 _ABOUT = ('Transport Experiment is a program for running electrical transport '
@@ -34,6 +36,7 @@ _ABOUT = ('Transport Experiment is a program for running electrical transport '
 
 def showAboutWindow(parent):
     """Display an "About" dialog."""
+    import wx.adv
 
     name = _NAME
     copyrightInfo = _COPYRIGHT
@@ -62,6 +65,7 @@ def getHelpWindow():
     wxHtmlHelpController
         A window containing software documentation
     """
+    import wx.html
     helpwindow = wx.html.HtmlHelpController()
     helpPath = pt.unrel('doc', 'htmlhelp', 'TransportExperimentdoc.hhp')
     if not helpwindow.AddBook(helpPath):
@@ -90,6 +94,11 @@ def getChangeLogDialog(parent):
     """
     return ChangeLogDialog(parent)
 
+@functools.lru_cache(maxsize=1)
+def _getChangelog():
+    """Return the change log, formatting it only the first time."""
+    return about.getChangelog()
+
 class ChangeLogDialog(wx.Dialog):
     """A dialog for displaying the software change log.
     
@@ -107,7 +116,7 @@ class ChangeLogDialog(wx.Dialog):
 
         self.textbox = wx.TextCtrl(self, wx.ID_ANY, style = wx.TE_MULTILINE)
         self.textbox.SetEditable(False)
-        self.textbox.SetValue(about.getChangelog())
+        self.textbox.SetValue(_getChangelog())
         sizer.Add(self.textbox, 1, wx.EXPAND | wx.ALL, 5)
 
         self.okbutton = wx.Button(self, wx.ID_OK, label = 'OK')
@@ -260,6 +269,7 @@ class FilesPanel(wx.Panel):
     def __init__(self, parent, user=False):
         super(FilesPanel, self).__init__(parent)
         self._user = user
+        self._dirDialog = None
 
         outerpanel = gh.Panel(self, 'vertical', 'Files')
 
@@ -277,7 +287,8 @@ class FilesPanel(wx.Panel):
         self.btnexpt.SetMinSize((30, txtheight))
         exptsizer.Add(self.textexpt, proportion = 1, flag = flags)
         exptsizer.Add(self.btnexpt, proportion = 0, flag = wx.ALL)
-        self.btnexpt.Bind(wx.EVT_BUTTON, self._onFolder)
+        self.btnexpt.Bind(wx.EVT_BUTTON,
+                         functools.partial(self._onFolder, self.textexpt))
 
         foldpanel = wx.Panel(mainpanel, wx.ID_ANY)
         foldsizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -291,7 +302,8 @@ class FilesPanel(wx.Panel):
         self.btnfold.SetMinSize((30, foldheight))
         foldsizer.Add(self.textfold, proportion = 1, flag = flags)
         foldsizer.Add(self.btnfold, proportion = 0, flag = wx.ALL)
-        self.btnfold.Bind(wx.EVT_BUTTON, self._onFolder)
+        self.btnfold.Bind(wx.EVT_BUTTON,
+                         functools.partial(self._onFolder, self.textfold))
 
         self.textfile = wx.TextCtrl(mainpanel, wx.ID_ANY)
         self.textfile.SetMinSize((245, -1))
@@ -313,24 +325,27 @@ class FilesPanel(wx.Panel):
         sizer.Add(outerpanel, 1, wx.EXPAND)
 
         self.fillData()
+        self.Bind(wx.EVT_WINDOW_DESTROY, self._onDestroy)
 
         self.SetAutoLayout(True)
         self.SetSizer(sizer)
         self.Layout()
 
-    def _onFolder(self, event):
-        """Browse for a directory."""
-        eventId = event.GetId()
-        if eventId == self.btnexpt.GetId():
-            defaultDirectory = self.textexpt.GetValue()
-        else:
-            defaultDirectory = self.textfold.GetValue()
-        dialog = wx.DirDialog(self, 'Choose a directory', defaultDirectory)
+    def _onFolder(self, textctrl, event):
+        """Browse for a directory and put it in `textctrl`."""
+        if self._dirDialog is None:
+            self._dirDialog = wx.DirDialog(self, 'Choose a directory')
+        dialog = self._dirDialog
+        dialog.SetPath(textctrl.GetValue())
         if dialog.ShowModal() == wx.ID_OK:
-            if eventId == self.btnexpt.GetId():
-                self.textexpt.SetValue(dialog.GetPath())
-            else:
-                self.textfold.SetValue(dialog.GetPath())
+            textctrl.SetValue(dialog.GetPath())
+
+    def _onDestroy(self, event):
+        """Destroy the reusable directory dialog along with the panel."""
+        if event.GetEventObject() is self and self._dirDialog:
+            self._dirDialog.Destroy()
+            self._dirDialog = None
+        event.Skip()
 
     def fillData(self):
         """Fill controls with data from the system configuration."""
@@ -507,7 +522,7 @@ class GraphsPanel(wx.Panel):
         if dialog.ShowModal() == wx.ID_OK:
             tup = _colorDataToTuple(dialog.GetColourData())
             self.graphColors.append(tup)
-            self._tupleListToStrings()
+            self.colorlist.Append(_formatColor(tup))
         self._updateButtons(None)
 
     def _onEdit(self, event):
@@ -521,14 +536,15 @@ class GraphsPanel(wx.Panel):
         if dialog.ShowModal() == wx.ID_OK:
             tup = _colorDataToTuple(dialog.GetColourData())
             self.graphColors[index] = tup
-            self._tupleListToStrings()
+            self.colorlist.SetString(index, _formatColor(tup))
+            self.colorlist.SetSelection(index)
         self._updateButtons(None)
 
     def _onRemove(self, event):
         """Remove the selected color from the list."""
         index = self.colorlist.GetSelection()
         del self.graphColors[index]
-        self._tupleListToStrings()
+        self.colorlist.Delete(index)
         if len(self.graphColors) > 0:
             self.colorlist.SetSelection(0)
         self._updateButtons(None)
@@ -536,19 +552,28 @@ class GraphsPanel(wx.Panel):
     def _onMoveUp(self, event):
         """Move the selected color up."""
         index = self.colorlist.GetSelection()
-        self.graphColors.insert(index - 1, self.graphColors.pop(index))
-        self._tupleListToStrings()
+        self._swapColors(index - 1, index)
         self.colorlist.SetSelection(index - 1)
         self._updateButtons(None)
 
     def _onMoveDown(self, event):
         """Move the selected color down."""
         index = self.colorlist.GetSelection()
-        self.graphColors.insert(index + 1, self.graphColors.pop(index))
-        self._tupleListToStrings()
+        self._swapColors(index, index + 1)
         self.colorlist.SetSelection(index + 1)
         self._updateButtons(None)
 
+    def _swapColors(self, first, second):
+        """Exchange two adjacent colors in the list and in the list box."""
+        colors = self.graphColors
+        colors[first], colors[second] = colors[second], colors[first]
+        self.colorlist.Freeze()
+        try:
+            self.colorlist.SetString(first, _formatColor(colors[first]))
+            self.colorlist.SetString(second, _formatColor(colors[second]))
+        finally:
+            self.colorlist.Thaw()
+
     def _indexTupleToColor(self, index):
         """Convert a color tuple to a color object.
         
@@ -577,24 +602,24 @@ class GraphsPanel(wx.Panel):
             A list of string representations of the colors in the graph color
             list. Each string contains three elements (RGB data)
         """
-        graphColorStrings = []
         previousSelection = self.colorlist.GetSelection()
-        print(repr(self.graphColors))
-        if isinstance(self.graphColors, str):
-            self.graphColors = eval(self.graphColors)
-        for col in self.graphColors:
-            col1 = '%.2f' % float(col[0])
-            col2 = '%.2f' % float(col[1])
-            col3 = '%.2f' % float(col[2])
-            graphColorStrings.append(', '.join([col1, col2, col3]))
-        self.colorlist.SetItems(graphColorStrings)
-        if 0 <= previousSelection < len(graphColorStrings):
-            self.colorlist.SetSelection(previousSelection)
+        log.debug('graphColors=%r', self.graphColors)
+        graphColorStrings = [_formatColor(col) for col in self.graphColors]
+        self.colorlist.Freeze()
+        try:
+            self.colorlist.SetItems(graphColorStrings)
+            if 0 <= previousSelection < len(graphColorStrings):
+                self.colorlist.SetSelection(previousSelection)
+        finally:
+            self.colorlist.Thaw()
         return graphColorStrings
 
     def fillData(self):
         """Fill the controls with data from the software configuration."""
-        self.graphColors = c.getGraphColors()
+        graphColors = c.getGraphColors()
+        if isinstance(graphColors, str):
+            graphColors = ast.literal_eval(graphColors)
+        self.graphColors = graphColors
         self._tupleListToStrings()
         self.colorlist.SetSelection(0)
         self.delayvalue.SetValue(str(c.getGraphDelay()))
@@ -675,13 +700,12 @@ class UsersPanel(wx.Panel):
     def _onAdd(self, event):
         """Add a new user."""
         finished = False
-        pattern = re.compile(r'[^a-zA-Z0-9_]')
         while not finished:
             dialog = wx.TextEntryDialog(self, 'New user name.', 'Username',
                                         '', style = wx.OK | wx.CANCEL)
             if dialog.ShowModal() == wx.ID_OK:
                 newusername = dialog.GetValue()
-                if re.search(pattern, newusername):
+                if _USERNAME_RE.search(newusername):
                     message = wx.MessageDialog(self, _USERNAME_ERROR_MESSAGE,
                                                'Error', wx.OK | wx.ICON_ERROR)
                     message.ShowModal()
@@ -692,7 +716,11 @@ class UsersPanel(wx.Panel):
                 else:
                     c.addUser(newusername)
                     self.users.append(newusername)
-                    self.userlist.SetItems(self.users)
+                    self.userlist.Freeze()
+                    try:
+                        self.userlist.SetItems(self.users)
+                    finally:
+                        self.userlist.Thaw()
                     finished = True
             else:
                 finished = True
@@ -700,18 +728,38 @@ class UsersPanel(wx.Panel):
     def _onRemove(self, event):
         """Delete the selected user."""
         sel = self.userlist.GetSelection()
-        if sel >= 0:
-            c.removeUser(self.userlist.GetString(sel))
-            self.userlist.Delete(sel)
-            del self.users[sel]
-        if len(self.users) >= 0:
-            self.userlist.SetSelection(0)
-        else:
-            self.userlist.SetSelection(-1)
+        self.userlist.Freeze()
+        try:
+            if sel >= 0:
+                c.removeUser(self.userlist.GetString(sel))
+                self.userlist.Delete(sel)
+                del self.users[sel]
+            if len(self.users) >= 0:
+                self.userlist.SetSelection(0)
+            else:
+                self.userlist.SetSelection(-1)
+        finally:
+            self.userlist.Thaw()
 
 
 # Helper Functions -------------------------------------------------------------
 
+def _formatColor(color):
+    """Convert a color tuple to the string shown in the color list.
+    
+    Parameters
+    ----------
+    color : tuple of float
+        A 3-tuple of floats specifying the RGB values of a color.
+    
+    Returns
+    -------
+    str
+        The three values, each to two decimal places, separated by commas.
+    """
+    red, green, blue = color
+    return f'{float(red):.2f}, {float(green):.2f}, {float(blue):.2f}'
+
 def _colorDataToTuple(colorData):
     """Convert a color object to a color tuple.
     
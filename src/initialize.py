@@ -4,21 +4,16 @@ from src import about
 from src.tools import path_tools as pt
 
 _LINE_LENGTH = 70
+_CONF_FILE = pt.unrel('etc', 'logging.conf')
+_LOG_DIR = pt.unrel('log', sep='/')
 
 def initialize():
-    confFile = pt.unrel('etc', 'logging.conf')
-    logFile = pt.unrel('log', time.strftime(r'expt%Y-%m-%d.log'), sep='/')
-    logging.config.fileConfig(confFile, {'default_file': logFile})
+    logFile = f"{_LOG_DIR}/{time.strftime(r'expt%Y-%m-%d.log')}"
+    logging.config.fileConfig(_CONF_FILE, {'default_file': logFile})
     
     infoString = '%s  %s' % (about.APP_NAME, about.getVersion())
     
-    logging.info('')
-
-    logging.info('=' * _LINE_LENGTH)
-    extraSpace = _LINE_LENGTH - len(infoString) - 4
-    padLeft = extraSpace // 2
-    padRight = extraSpace // 2
-    if extraSpace % 2 == 1:
-        padRight += 1
-    logging.info('=' * padLeft + '  ' + infoString + '  ' + '=' * padRight)
-    logging.info('=' * _LINE_LENGTH)
+    bar = '=' * _LINE_LENGTH
+    banner = '\n'.join(['', bar,
+                        f'{"  " + infoString + "  ":=^{_LINE_LENGTH}}', bar])
+    logging.info('%s', banner)
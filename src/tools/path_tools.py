@@ -5,9 +5,11 @@ different path names. It's main function is to convert path names indicated
 relative to the Transport directory to absolute path names.
 """
 
+import importlib.util
 import logging
 import os
 import re
+import sys
 
 from src import about, settings
 
@@ -449,7 +451,38 @@ def getSourceFiles(directory):
             else:
                 output[base][item] = False
     return output
-        
+
+
+def loadModule(moduleName, path):
+    """Load a Python source file as a module.
+    
+    The module is loaded through the standard import machinery, so its
+    compiled bytecode is cached in `__pycache__` and reused while the source
+    is unchanged. Like the old `imp.load_source`, the module is registered in
+    `sys.modules` under `moduleName`.
+    
+    Parameters
+    ----------
+    moduleName : str
+        The name to give the module.
+    path : str
+        The path to the `.py` file.
+    
+    Returns
+    -------
+    module
+        The loaded module.
+    """
+    spec = importlib.util.spec_from_file_location(moduleName, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[moduleName] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[moduleName]
+        raise
+    return module
+
     
 if len(HOME_PATH) == 0:
     createHomePath()
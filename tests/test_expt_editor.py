@@ -0,0 +1,57 @@
+"""Regression tests for the action tree of the experiment editor."""
+
+import pytest
+
+wx = pytest.importorskip('wx')
+experiment = pytest.importorskip('src.core.experiment')
+expt_editor = pytest.importorskip('src.gui.main.expt_editor')
+
+
+class _AcceptedDialog(object):
+    """An action dialog which the user closes with OK and no changes."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def ShowModal(self):
+        return wx.ID_OK
+
+
+class _EditorFrame(wx.Frame):
+    """A frame providing the callbacks which the action tree expects."""
+
+    def setClipboardButtonStatus(self, cut, copy, paste):
+        pass
+
+    def flagEdit(self):
+        pass
+
+
+@pytest.fixture
+def tree():
+    """An empty action tree in a frame of its own."""
+    app = wx.App(False)
+    frame = _EditorFrame(None)
+    actionTree = expt_editor.ActionTree(frame, experiment.Experiment(),
+                                        parentFrame=frame)
+    yield actionTree
+    frame.Destroy()
+    del app
+
+
+def test_insert_into_pasted_loop_leaves_clipboard_unchanged(tree,
+                                                            monkeypatch):
+    monkeypatch.setattr(expt_editor.oc, 'getDialog',
+                        lambda action: _AcceptedDialog)
+    system = tree.experiment.getInstrument(0)
+    waitIndex = [spec.name for spec in system.getActions()].index('wait')
+
+    tree.clipboard = ('copy', system.getAction('scan_num', True), False)
+    tree.pasteAction(None)
+    loopItem = tree.GetLastChild(tree.root)
+    tree.insertAction((0, waitIndex), tree.GetLastChild(loopItem))
+    assert len(tree.GetItemData(loopItem).getChildren()) == 1
+
+    tree.pasteAction(None)
+    secondLoop = tree.GetItemData(tree.GetLastChild(tree.root))
+    assert secondLoop.getChildren() == []